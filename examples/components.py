@@ -18,7 +18,8 @@ pn.config.design = MaterialDesign
 color = pn.widgets.ColorPicker(value='#ff0000')
 dark = Checkbox(value=pn.config.theme=='dark')
 
-design_kwargs = dict(
+# All components share the theme of the document
+DocumentTheme.for_document().param.update(
     dark_theme=dark,
     theme_config={'palette': {'primary': {'main': color}}},
 )
@@ -42,7 +43,7 @@ def render_variant(component, variant, **kwargs):
 
     title = f'# {component.name}'
     if not variant:
-        return pn.Column(title, component(**dict(kwargs, **design_kwargs)), name=component.name)
+        return pn.Column(title, component(**kwargs), name=component.name)
     elif inspect.isfunction(variant):
         return variant(component, **kwargs)
     values = []
@@ -59,7 +60,7 @@ def render_variant(component, variant, **kwargs):
     cols = len(values[-1])
     clabels = ([''] if ndim > 1 else []) + [f'### {v}' for v in values[-1]]
     grid_items = [
-        component(**dict(zip(variant, vs), **dict(kwargs, **design_kwargs)))
+        component(**dict(zip(variant, vs), **kwargs))
         for vs in combinations
     ]
     if ndim > 1:
@@ -89,12 +90,12 @@ def render_spec(spec, depth=0, label='main'):
     if isinstance(spec, dict):
         tabs = Tabs(*(
             (title, render_spec(subspec, depth+1, label=title)) for title, subspec in spec.items()
-        ), sizing_mode='stretch_width', **design_kwargs)
+        ), sizing_mode='stretch_width')
     else:
         tabs = Tabs(*(
             pn.param.ParamFunction(pn.bind(show_variants, component, variants=varss, **kwargs), lazy=True, name=component.name)
             for component, varss,  kwargs in spec
-        ), dynamic=True, **design_kwargs)
+        ), dynamic=True)
     pn.state.location.sync(tabs, dict(active=f'active{label}'))
     return tabs
 
@@ -182,4 +183,4 @@ spec = {
     },
 }
 
-Page(header=[color, dark], main=[render_spec(spec)], sidebar=['# Foo'], title='panel-material-ui components', **design_kwargs).servable()
+Page(header=[color, dark], main=[render_spec(spec)], sidebar=['# Foo'], title='panel-material-ui components').servable()
@@ -1,35 +1,231 @@
 from __future__ import annotations
 
+import gzip
+import hashlib
+import json
+import multiprocessing
 import os
+import subprocess
 import sys
+import traceback
 
+from multiprocessing.connection import wait
 from pathlib import Path
+from typing import Callable
 
 from hatchling.builders.hooks.plugin.interface import BuildHookInterface
 
 BASE_DIR = Path(__file__).parent
+DIST_DIR = BASE_DIR / "src" / "panel_material_ui" / "dist"
+CHUNK_DIR = DIST_DIR / "chunks"
+# Records the input hash of each bundle, so unchanged bundles are not rebuilt
+BUILD_CACHE = BASE_DIR / ".bundle_cache.json"
+# Bump to invalidate existing caches when the build commands change
+BUILD_CACHE_VERSION = 1
+BUNDLE_FILE_LOADERS = ['woff', 'woff2']
+CHUNK_BUILD_OPTIONS = [
+    '--bundle', '--splitting', '--format=esm', '--minify',
+    '--loader:.js=jsx', '--loader:.woff=file', '--loader:.woff2=file',
+    '--entry-names=[name]', '--chunk-names=shared-[hash]', '--asset-names=[name]-[hash]',
+]
+# Fonts (woff/woff2) are already compressed and are therefore skipped
+COMPRESSIBLE = ('.js', '.css')
 GREEN, RED, RESET = "\033[0;32m", "\033[0;31m", "\033[0m"
 
 
+def compile_chunks(components, outdir: Path) -> int:
+    """
+    Compiles one entry module per component, which share the vendor
+    code (React, MUI, emotion, dayjs, ...) via code-split chunks. This
+    allows a page to only load the code for the components it renders.
+    """
+    from panel.io.compile import (
+        _EXPORT_DEFAULT_RE,
+        generate_index,
+        generate_project,
+        npm_install,
+        setup_build_dir,
+    )
+
+    print(f"{GREEN}[PANEL-MATERIAL-UI]{RESET} Compile per-component chunks", flush=True)
+    outdir.mkdir(parents=True, exist_ok=True)
+    for stale in outdir.glob('*'):
+        stale.unlink()
+    with setup_build_dir() as build_dir:
+        generate_project(components, build_dir)
+        try:
+            npm_install(False, None)
+        except subprocess.CalledProcessError as e:
+            print(f"{RED}[PANEL-MATERIAL-UI]{RESET} npm install failed:\n{e.stderr}", flush=True)
+            return 1
+        entry_dir = build_dir / 'entries'
+        entry_dir.mkdir()
+        entries = []
+        for component in components:
+            name = component.__name__
+            code = (build_dir / f'{name}.js').read_text()
+            if _EXPORT_DEFAULT_RE.search(code):
+                imports = f'import {name} from "../{name}"\n'
+            else:
+                imports = f'import * as {name} from "../{name}"\n'
+            entry = entry_dir / f'{name}.js'
+            entry.write_text(generate_index(imports, [name], component._exports__))
+            entries.append(str(entry.relative_to(build_dir)))
+        build_cmd = ['esbuild', *entries, *CHUNK_BUILD_OPTIONS, f'--outdir={outdir}']
+        result = subprocess.run(build_cmd, capture_output=True, text=True)
+        if result.returncode:
+            print(f"{RED}[PANEL-MATERIAL-UI]{RESET} esbuild failed:\n{result.stderr}", flush=True)
+            return 1
+    return 0
+
+
+def bundle_hash(components, *options) -> str:
+    """
+    Hashes the inputs of a bundle, i.e. the transformed ESM code of each
+    component, the npm dependencies it imports, its exports and the
+    supplied build options.
+    """
+    import panel
+
+    from panel.io.compile import extract_dependencies
+
+    digest = hashlib.sha256()
+    digest.update(json.dumps([BUILD_CACHE_VERSION, panel.__version__, *options]).encode())
+    for component in sorted(components, key=lambda c: c.__name__):
+        code, dependencies = extract_dependencies(component)
+        spec = [component.__name__, code, dependencies, component._exports__]
+        digest.update(json.dumps(spec, sort_keys=True, default=str).encode())
+    return digest.hexdigest()
+
+
+def load_build_cache() -> dict[str, str]:
+    if os.environ.get('PANEL_MATERIAL_UI_FORCE_BUILD') or not BUILD_CACHE.is_file():
+        return {}
+    try:
+        return json.loads(BUILD_CACHE.read_text())
+    except ValueError:
+        return {}
+
+
+def compile_module_bundle(components, bundle: Path) -> int:
+    """
+    Compiles the monolithic bundle containing all supplied components.
+    """
+    from panel.io.compile import compile_components
+
+    ret = compile_components(components, outfile=bundle, file_loaders=BUNDLE_FILE_LOADERS)
+    return 1 if ret is None else ret
+
+
+def _call_job(func: Callable[..., int], args: tuple) -> int:
+    try:
+        return func(*args)
+    except Exception:
+        traceback.print_exc()
+        return 1
+
+
+def _run_job(func: Callable[..., int], args: tuple) -> None:
+    errors = _call_job(func, args)
+    sys.stdout.flush()
+    sys.exit(min(errors, 255))
+
+
+def run_jobs(jobs: dict[str, tuple[Callable[..., int], tuple]]) -> dict[str, int]:
+    """
+    Runs independent build jobs concurrently, each in a forked process
+    (the compilers change the working directory, which rules out
+    threads), and returns the number of errors reported by each job.
+
+    The number of concurrent jobs can be limited by setting the
+    PANEL_MATERIAL_UI_BUILD_JOBS environment variable. Platforms
+    without fork support compile the jobs sequentially.
+    """
+    workers = int(os.environ.get('PANEL_MATERIAL_UI_BUILD_JOBS', os.cpu_count() or 1))
+    if workers < 2 or len(jobs) < 2 or 'fork' not in multiprocessing.get_all_start_methods():
+        return {key: _call_job(func, args) for key, (func, args) in jobs.items()}
+    context = multiprocessing.get_context('fork')
+    pending, running, errors = list(jobs.items()), {}, {}
+    # Avoid duplicating buffered output in the forked processes
+    sys.stdout.flush()
+    sys.stderr.flush()
+    while pending or running:
+        while pending and len(running) < workers:
+            key, (func, args) = pending.pop(0)
+            process = context.Process(target=_run_job, args=(func, args), name=key)
+            process.start()
+            running[process.sentinel] = (key, process)
+        for sentinel in wait(list(running)):
+            key, process = running.pop(sentinel)
+            process.join()
+            # A negative exit code means the process was killed by a signal
+            errors[key] = process.exitcode if process.exitcode > 0 else int(process.exitcode != 0)
+    return errors
+
+
+def compress_dist(dist_dir: Path) -> None:
+    """
+    Writes gzip and (if the brotli package is available) brotli
+    compressed variants next to each compressible file in the dist
+    directory, so they can be served without compressing per request.
+    Variants which are newer than their source file are kept.
+    """
+    try:
+        import brotli
+    except ImportError:
+        brotli = None
+        print(f"{RED}[PANEL-MATERIAL-UI]{RESET} brotli not installed, skipping .br artifacts", flush=True)
+    for path in dist_dir.rglob('*'):
+        if path.suffix not in COMPRESSIBLE:
+            continue
+        mtime = path.stat().st_mtime_ns
+        gz_path, br_path = path.with_name(f'{path.name}.gz'), path.with_name(f'{path.name}.br')
+        compress_gz = not gz_path.is_file() or gz_path.stat().st_mtime_ns < mtime
+        compress_br = brotli is not None and (not br_path.is_file() or br_path.stat().st_mtime_ns < mtime)
+        if not (compress_gz or compress_br):
+            continue
+        data = path.read_bytes()
+        if compress_gz:
+            gz_path.write_bytes(gzip.compress(data, compresslevel=9, mtime=0))
+        if compress_br:
+            br_path.write_bytes(brotli.compress(data, quality=11))
+
+
 def compile_bundle():
-    from panel.io.compile import compile_components, find_module_bundles
+    from panel.io.compile import find_module_bundles
 
     print(f"{GREEN}[PANEL-MATERIAL_UI]{RESET} Compile panel-material-ui bundle", flush=True)
     panel_dir = BASE_DIR / "panel"
 
     sys.path.insert(0, str(BASE_DIR / "src"))
-    module_bundles = find_module_bundles('panel_material_ui')
-    errors = 0
+    module_bundles = find_module_bundles('panel_material_ui.bundle')
+    cache, new_cache = load_build_cache(), {}
+    jobs, digests = {}, {}
     for bundle, components in module_bundles.items():
-        ret = compile_components(
-            components,
-            outfile=bundle,
-            file_loaders=['woff', 'woff2']
-        )
-        if ret is None:
-            errors += 1
+        key = Path(bundle).name
+        digests[key] = digest = bundle_hash(components, *BUNDLE_FILE_LOADERS)
+        if cache.get(key) == digest and Path(bundle).is_file():
+            print(f"{GREEN}[PANEL-MATERIAL-UI]{RESET} {key} is up to date", flush=True)
+            new_cache[key] = digest
         else:
+            jobs[key] = (compile_module_bundle, (components, bundle))
+    components = [c for cs in module_bundles.values() for c in cs if c._esm_base]
+    digests['chunks'] = digest = bundle_hash(components, *CHUNK_BUILD_OPTIONS)
+    if cache.get('chunks') == digest and all((CHUNK_DIR / f'{c.__name__}.js').is_file() for c in components):
+        print(f"{GREEN}[PANEL-MATERIAL-UI]{RESET} Per-component chunks are up to date", flush=True)
+        new_cache['chunks'] = digest
+    else:
+        jobs['chunks'] = (compile_chunks, (components, CHUNK_DIR))
+    errors = 0
+    for key, ret in run_jobs(jobs).items():
+        if ret:
+            print(f"{RED}[PANEL-MATERIAL-UI]{RESET} Failed compiling {key}", flush=True)
             errors += ret
+        else:
+            new_cache[key] = digests[key]
+    BUILD_CACHE.write_text(json.dumps(new_cache, indent=2))
+    if not errors:
+        compress_dist(DIST_DIR)
     if sys.platform != "win32":
         # npm can cause non-blocking stdout; so reset it just in case
         import fcntl
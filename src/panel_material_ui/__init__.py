@@ -1,6 +1,81 @@
+"""
+Material UI components for Panel.
+
+Components are imported lazily on first attribute access (PEP 562),
+which keeps `import panel_material_ui` cheap for processes that only
+use a few components, or none at all. Only the theme is imported
+eagerly, since it makes the Material design the default Panel design.
+"""
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+from . import theme  # noqa: F401
 from .__version import __version__  # noqa
-from .layout import *  # noqa
-from .pane import *  # noqa
-from .template import *  # noqa
-from .theme import MaterialDesign  # noqa
-from .widgets import *  # noqa
+
+# Maps each public component to the submodule it is defined in
+_LAZY_IMPORTS = {
+    'COLORS': 'base',
+    'MaterialComponent': 'base',
+    'ThemedTransform': 'base',
+    'DocumentTheme': 'theme',
+    'MaterialDesign': 'theme',
+    'Accordion': 'layout',
+    'Alert': 'layout',
+    'Backdrop': 'layout',
+    'Card': 'layout',
+    'Dialog': 'layout',
+    'Divider': 'layout',
+    'MaterialListLike': 'layout',
+    'MaterialNamedListLike': 'layout',
+    'Paper': 'layout',
+    'Tabs': 'layout',
+    'Avatar': 'pane',
+    'Breadcrumbs': 'pane',
+    'Chip': 'pane',
+    'List': 'pane',
+    'Skeleton': 'pane',
+    'Page': 'template',
+    **{name: 'widgets' for name in (
+        'MaterialWidget', 'TooltipTransform', 'Button', 'Toggle',
+        'ButtonIcon', 'ToggleIcon', 'LoadingIndicator', 'Progress',
+        'Checkbox', 'DatePicker', 'DateRangePicker', 'DatetimePicker',
+        'DatetimeRangePicker', 'FileInput', 'FloatInput', 'IntInput',
+        'MaterialInputWidget', 'NumberInput', 'PasswordInput', 'Switch',
+        'TextAreaInput', 'TextInput', 'TimePicker', 'AutocompleteInput',
+        'ButtonGroup', 'CheckBoxGroup', 'CheckButtonGroup',
+        'MaterialMultiSelectBase', 'MaterialSingleSelectBase',
+        'MultiChoice', 'RadioBoxGroup', 'RadioButtonGroup', 'RadioGroup',
+        'Select', 'FloatSlider', 'IntRangeSlider', 'IntSlider',
+        'RangeSlider', 'Rating',
+    )},
+}
+
+_SUBMODULES = ('base', 'chat', 'icons', 'layout', 'pane', 'template', 'theme', 'widgets')
+
+__all__ = ['__version__', *_LAZY_IMPORTS]
+
+
+def __getattr__(name: str):
+    if name in _SUBMODULES:
+        return importlib.import_module(f'.{name}', __name__)
+    elif name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f'.{_LAZY_IMPORTS[name]}', __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+
+if TYPE_CHECKING:
+    from .base import COLORS, MaterialComponent, ThemedTransform  # noqa
+    from .layout import *  # noqa
+    from .pane import *  # noqa
+    from .template import *  # noqa
+    from .theme import DocumentTheme, MaterialDesign  # noqa
+    from .widgets import *  # noqa
@@ -1,25 +1,34 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import inspect
+import os
 import pathlib
+import subprocess
 import textwrap
-from typing import TYPE_CHECKING, Any, Literal
+from typing import TYPE_CHECKING, Any, ClassVar, Literal
 
 import param
 from panel.config import config
 from panel.custom import ReactComponent
+from panel.io.state import state
 from panel.util import base_version, classproperty
 
 from .__version import __version__  # noqa
-from .theme import MaterialDesign
+from .theme import DocumentTheme, MaterialDesign
 
 if TYPE_CHECKING:
     from bokeh.document import Document
+    from bokeh.model import Model
+    from pyviz_comms import Comm
 
 COLORS = ["primary", "secondary", "error", "info", "success", "warning"]
 
 BASE_PATH = pathlib.Path(__file__).parent
-CDN_DIST = f"https://cdn.holoviz.org/panel-material-ui/v{__version__}/panel-material-ui.bundle.js"
+CDN_BASE = f"https://cdn.holoviz.org/panel-material-ui/v{__version__}/"
+CDN_DIST = f"{CDN_BASE}panel-material-ui.bundle.js"
+CHUNK_PATH = BASE_PATH / "dist" / "chunks"
 
 
 class ESMTransform:
@@ -43,73 +52,166 @@ class ESMTransform:
 
 
 class ThemedTransform(ESMTransform):
+    """
+    ThemedTransform wraps a component in a ThemeProvider. The theme is
+    resolved from the DocumentTheme model shared by all components and
+    the overrides of the component. MUI themes are memoized in a small
+    LRU cache keyed by the theme_config and dark_theme and shared by all
+    components, each component only layers its own popup container on
+    top of the shared theme.
+    """
 
     _transform = """\
 import * as React from "react"
-import 'material-icons/iconfont/material-icons.css';
+import 'material-icons/iconfont/filled.css';
 import {{ ThemeProvider, createTheme }} from '@mui/material/styles';
 import {{ deepmerge }} from '@mui/utils';
 import CssBaseline from '@mui/material/CssBaseline';
 
 {esm}
 
+const THEME_CACHE_SIZE = 16
+
+function stableKey(value) {{
+  if (Array.isArray(value)) {{
+    return `[${{value.map(stableKey).join(",")}}]`
+  }} else if (value !== null && typeof value === "object") {{
+    const keys = Object.keys(value).sort()
+    return `{{${{keys.map((k) => `${{JSON.stringify(k)}}:${{stableKey(value[k])}}`).join(",")}}}}`
+  }}
+  return JSON.stringify(value) ?? "null"
+}}
+
+function getTheme(theme_config, dark_theme) {{
+  // Themes are shared by all components with the same configuration,
+  // the Map iteration order is used to evict the least recently used
+  const themes = window.__panel_material_ui_themes__ ??= new Map()
+  const key = stableKey([theme_config ?? null, Boolean(dark_theme)])
+  let theme = themes.get(key)
+  if (theme === undefined) {{
+    const config = deepmerge(
+      theme_config ?? {{}},
+      {{
+        cssVariables: {{
+          rootSelector: ':host',
+          colorSchemeSelector: 'class',
+        }},
+        palette: {{
+          mode: dark_theme ? "dark" : "light"
+        }},
+      }}
+    )
+    theme = createTheme(config)
+    if (themes.size >= THEME_CACHE_SIZE) {{
+      themes.delete(themes.keys().next().value)
+    }}
+  }} else {{
+    themes.delete(key)
+  }}
+  themes.set(key, theme)
+  return theme
+}}
+
+function updateGlobalStyles(theme) {{
+  // All components funnel through a single writer which owns the global
+  // style element, coalesces updates within a tick and skips the DOM
+  // write entirely if the variables did not change.
+  const globals = window.__panel_material_ui_globals__ ??= {{css: null, element: null, pending: null}}
+  globals.pending = theme
+  if (globals.scheduled) {{
+    return
+  }}
+  globals.scheduled = true
+  queueMicrotask(() => {{
+    const palette = globals.pending.palette
+    globals.scheduled = false
+    globals.pending = null
+    const css = `
+      :root, :host {{
+        --panel-primary-color: ${{palette.primary.main}};
+        --panel-on-primary-color: ${{palette.primary.contrastText}};
+        --panel-secondary-color: ${{palette.secondary.main}};
+        --panel-on-secondary-color: ${{palette.secondary.contrastText}};
+        --panel-background-color: ${{palette.background.default}};
+        --panel-on-background-color: ${{palette.text.primary}};
+        --panel-surface-color: ${{palette.background.paper}};
+        --panel-on-surface-color: ${{palette.text.primary}};
+      }}
+    `
+    let styleElement = globals.element
+    if (css === globals.css && styleElement?.isConnected) {{
+      return
+    }}
+    if (!styleElement?.isConnected) {{
+      styleElement = document.querySelector("#global-styles-panel-mui")
+    }}
+    if (!styleElement) {{
+      styleElement = document.createElement("style")
+      styleElement.id = "global-styles-panel-mui"
+      document.head.appendChild(styleElement)
+    }}
+    if (styleElement.textContent !== css) {{
+      styleElement.textContent = css
+    }}
+    globals.element = styleElement
+    globals.css = css
+  }})
+}}
+
+function useThemeProperty(theme_model, prop) {{
+  // Subscribes to a property of the theme shared by all components
+  const [value, setValue] = React.useState(theme_model?.[prop])
+  React.useEffect(() => {{
+    if (theme_model == null) {{
+      return
+    }}
+    const update = () => setValue(theme_model[prop])
+    update()
+    theme_model.property(prop).change.connect(update)
+    return () => {{ theme_model.property(prop).change.disconnect(update) }}
+  }}, [theme_model])
+  return value
+}}
+
 function {output}(props) {{
-  const [dark_theme] = props.model.useState('dark_theme')
-  const [theme_config ] = props.model.useState('theme_config')
-
-  const config = deepmerge(
-    theme_config,
-    {{
-      cssVariables: {{
-        rootSelector: ':host',
-        colorSchemeSelector: 'class',
-      }},
-      palette: {{
-        mode: dark_theme ? "dark" : "light"
-      }},
-      components: {{
+  const [theme_model] = props.model.useState('theme')
+  const [local_dark_theme] = props.model.useState('dark_theme')
+  const [local_theme_config] = props.model.useState('theme_config')
+  const shared_dark_theme = useThemeProperty(theme_model, 'dark_theme')
+  const shared_theme_config = useThemeProperty(theme_model, 'theme_config')
+  const container = props.view.container
+
+  const dark_theme = local_dark_theme ?? shared_dark_theme
+  const theme_config = React.useMemo(() => (
+    local_theme_config == null ? shared_theme_config : deepmerge(shared_theme_config ?? {{}}, local_theme_config)
+  ), [shared_theme_config, local_theme_config])
+
+  const shared_theme = React.useMemo(() => getTheme(theme_config, dark_theme), [theme_config, dark_theme])
+  const theme = React.useMemo(() => ({{
+    ...shared_theme,
+    components: deepmerge(
+      shared_theme.components ?? {{}},
+      {{
         MuiPopover: {{
           defaultProps: {{
-            container: props.view.container,
+            container,
           }},
         }},
         MuiPopper: {{
           defaultProps: {{
-            container: props.view.container,
+            container,
           }},
         }},
         MuiModal: {{
           defaultProps: {{
-            container: props.view.container,
+            container,
           }},
         }},
       }}
-    }}
-  )
-  const theme = createTheme(config);
-
-  React.useEffect(() => {{
-    let styleElement = document.querySelector("#global-styles-panel-mui");
-    if (!styleElement) {{
-      styleElement = document.createElement("style");
-      styleElement.id = "global-styles-panel-mui";
-      document.head.appendChild(styleElement)
-    }}
-
-    styleElement.textContent = `
-      :root, :host {{
-        --panel-primary-color: ${{theme.palette.primary.main}};
-        --panel-on-primary-color: ${{theme.palette.primary.contrastText}};
-        --panel-secondary-color: ${{theme.palette.secondary.main}};
-        --panel-on-secondary-color: ${{theme.palette.secondary.contrastText}};
-        --panel-background-color: ${{theme.palette.background.default}};
-        --panel-on-background-color: ${{theme.palette.text.primary}};
-        --panel-surface-color: ${{theme.palette.background.paper}};
-        --panel-on-surface-color: ${{theme.palette.text.primary}};
-      }}
-    `;
+    )
+  }}), [shared_theme, container])
 
-  }}, [theme]);
+  React.useEffect(() => updateGlobalStyles(shared_theme), [shared_theme])
 
   return (
     <ThemeProvider theme={{theme}}>
@@ -127,12 +229,32 @@ class MaterialComponent(ReactComponent):
     the JS dependencies and theming support via the ThemedTransform.
     """
 
-    dark_theme = param.Boolean()
+    dark_theme = param.Boolean(default=None, allow_None=True, doc="""
+        Whether to use the dark mode palette, overrides the theme.""")
+
+    theme = param.ClassSelector(class_=DocumentTheme, default=None, doc="""
+        The theme shared with other components, defaults to the theme
+        of the document the component is rendered in.""")
 
-    theme_config = param.Dict(default=None, nested_refs=True, doc="Options to configure the ThemeProvider")
+    theme_config = param.Dict(default=None, nested_refs=True, doc="""
+        Options to configure the ThemeProvider, merged with the theme_config of the theme.""")
 
     _bundle = BASE_PATH / "dist" / "panel-material-ui.bundle.js"
     _esm_base = None
+    _esm_cache: ClassVar[dict[type[MaterialComponent], tuple[tuple[Any, ...], str]]] = {}
+    _bundle_css_cache: ClassVar[dict[type[MaterialComponent], list[str]]] = {}
+    _compact_data_models: ClassVar[set[type[MaterialComponent]]] = set()
+    # Set when the content-hashed dist route is served (see panel_material_ui.server)
+    _dist_route: ClassVar[str | None] = None
+    # Build directory with installed node_modules (e.g. the --build-dir used by
+    # `panel compile`), enables hot swapping of edited components in autoreload mode
+    _hot_build_dir: ClassVar[str | None] = os.environ.get('PANEL_MATERIAL_UI_HOT_BUILD_DIR')
+    _hot_cache: ClassVar[dict[type[MaterialComponent], tuple[tuple[int, int], tuple[str, str]]]] = {}
+    _hot_futures: ClassVar[dict[type[MaterialComponent], asyncio.Future]] = {}
+    # Coalesces the parameter changes of a component made within one tick
+    # of the event loop into a single patch, see _param_change
+    _batch_updates: ClassVar[bool] = os.environ.get('PANEL_MATERIAL_UI_BATCH_UPDATES', '').lower() in ('1', 'true')
+    _pending_events: dict[str, param.parameterized.Event] | None = None
     _esm_transforms = [ThemedTransform]
     _importmap = {
         "imports": {
@@ -147,16 +269,119 @@ class MaterialComponent(ReactComponent):
     __abstract = True
 
     def __init__(self, **params):
-        if 'dark_theme' not in params:
-            params['dark_theme'] = config.theme == 'dark'
         if 'design' not in params:
             params['design'] = MaterialDesign
         super().__init__(**params)
+        # The theme providing the shared theme model, indexed by root
+        self._themes: dict[str, DocumentTheme] = {}
+        # The bundle properties computed by ReactiveESM._get_properties
+        self._bundle_props: dict[bool, dict[str, Any]] = {}
 
     async def _watch_esm(self):
         import watchfiles
-        async for _ in watchfiles.awatch(self._bundle, stop_event=self._watching_esm):
-            self._update_esm()
+        dist = pathlib.Path(self._bundle).parent
+        paths = [dist]
+        if self._esm_base:
+            paths.append(self._esm_path(compiled='compiling'))
+        async for changes in watchfiles.awatch(*paths, stop_event=self._watching_esm):
+            changed = {pathlib.Path(path) for _, path in changes}
+            type(self)._invalidate_esm_cache(changed)
+            if any(dist in path.parents for path in changed):
+                self._bundle_css_cache.clear()
+            hot_swap = self._hot_build_dir and self._esm_base and self._esm_path(compiled='compiling') in changed
+            if hot_swap:
+                await type(self)._compile_hot_esm_async()
+            if hot_swap or pathlib.Path(self._bundle) in changed:
+                self._update_esm()
+
+    @property
+    def _linked_properties(self) -> tuple[str, ...]:
+        return tuple(p for p in super()._linked_properties if p != 'theme')
+
+    def _param_change(self, *events: param.parameterized.Event) -> None:
+        # Changes made while processing events from the frontend are
+        # applied immediately to avoid reordering them with those events
+        if not (self._batch_updates and self._models) or self._in_process__events:
+            self._flush_param_changes()
+            super()._param_change(*events)
+            return
+        if self._pending_events is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                # Nothing to batch in without a running event loop
+                super()._param_change(*events)
+                return
+            self._pending_events = {}
+            loop.call_soon(self._flush_param_changes)
+        for event in events:
+            pending = self._pending_events.get(event.name)
+            # The merged event spans all changes of the parameter
+            self._pending_events[event.name] = event if pending is None else event._replace(old=pending.old)
+
+    def _flush_param_changes(self) -> None:
+        events, self._pending_events = self._pending_events, None
+        if events:
+            super()._param_change(*events.values())
+
+    def _process_param_change(self, params):
+        props = super()._process_param_change(params)
+        if 'theme' in props:
+            # Replaced with the model shared by all components in the
+            # document, see _get_model and _update_model
+            props['theme'] = None
+        return props
+
+    def _get_model(
+        self, doc: Document, root: Model | None = None,
+        parent: Model | None = None, comm: Comm | None = None
+    ) -> Model:
+        model = super()._get_model(doc, root, parent, comm)
+        root = root or model
+        theme = self._themes[root.ref['id']] = self.theme or DocumentTheme.for_document(doc)
+        model.data.theme = theme._get_model(doc, root, model, comm)
+        return model
+
+    def _update_model(
+        self, events: dict[str, param.parameterized.Event], msg: dict[str, Any],
+        root: Model, model: Model, doc: Document, comm: Comm | None
+    ) -> None:
+        if 'theme' in msg:
+            ref = root.ref['id']
+            if ref in self._themes:
+                self._themes[ref]._release(root, model)
+            theme = self._themes[ref] = self.theme or DocumentTheme.for_document(doc)
+            msg['theme'] = theme._get_model(doc, root, model, comm)
+        # ReactiveESM would route these to the data model
+        bundle_msg = {prop: msg.pop(prop) for prop in ('bundle', 'css_bundle') if prop in msg}
+        if bundle_msg:
+            self._set_on_model(bundle_msg, root, model)
+        super()._update_model(events, msg, root, model, doc, comm)
+
+    def _cleanup(self, root: Model | None = None) -> None:
+        if root is not None and root.ref['id'] in self._themes:
+            theme = self._themes.pop(root.ref['id'])
+            if root.ref['id'] in self._models:
+                theme._release(root, self._models[root.ref['id']][0])
+        super()._cleanup(root)
+
+    def _update_esm(self):
+        # Like the base implementation, which only refreshes the esm,
+        # but also switches between the compiled bundle and a hot module
+        for ref, (model, _) in self._models.copy().items():
+            if ref not in state._views:
+                continue
+            doc = state._views[ref][2]
+            is_session = bool(doc.session_context and doc.session_context.server_context)
+            props = dict(
+                self._bundle_props[is_session],
+                esm=self._render_esm(not config.autoreload, server=is_session),
+                importmap=self._process_importmap(),
+            )
+            self._resolve_bundle(props)
+            update = {prop: value for prop, value in props.items() if getattr(model, prop) != value}
+            if update:
+                self._apply_update({}, update, model, ref)
 
     @classmethod
     def _esm_path(cls, compiled=True):
@@ -171,17 +396,152 @@ class MaterialComponent(ReactComponent):
 
     @classproperty
     def _bundle_css(cls):
-        if not config.autoreload and __version__ == base_version(__version__):
+        if cls._dist_route and not config.autoreload:
+            from .server import bundle_css_variant, session_dist_url
+            css_path = (cls._chunk_path or cls._bundle).with_suffix('.css')
+            # Panel only passes absolute URLs through unmodified
+            url = session_dist_url(css_path, bundle_css_variant()) if css_path.is_file() else None
+            if url is not None:
+                return [url]
+        elif not config.autoreload and __version__ == base_version(__version__):
             return [CDN_DIST.replace('.js', '.css')]
-        esm_path = cls._esm_path(compiled=True)
-        css_path = esm_path.with_suffix('.css')
-        if css_path.is_file():
-            return [str(css_path)] + [str(p) for p in (BASE_PATH / 'dist').glob('material-icons-*.woff*')]
-        return []
+        # Resolving the CSS requires a stat and a glob of the dist
+        # directory, cache it until the dist directory changes
+        if cls not in cls._bundle_css_cache:
+            esm_path = cls._esm_path(compiled=True)
+            css_path = esm_path.with_suffix('.css')
+            if css_path.is_file():
+                css = [str(css_path)] + [str(p) for p in (BASE_PATH / 'dist').glob('material-icons-*.woff*')]
+            else:
+                css = []
+            cls._bundle_css_cache[cls] = css
+        return list(cls._bundle_css_cache[cls])
+
+    @classproperty
+    def _chunk_path(cls) -> pathlib.Path | None:
+        """
+        The per-component entry module, which loads only the code required
+        by this component and shares vendor code with other components.
+        """
+        if cls._esm_base is None:
+            return None
+        chunk_path = CHUNK_PATH / f'{cls.__name__}.js'
+        return chunk_path if chunk_path.is_file() else None
+
+    @classmethod
+    def _compile_hot_esm(cls) -> str:
+        """
+        Compiles the component on its own into a self-contained ES module,
+        resolving its dependencies from the node_modules in the hot build
+        directory. CSS and fonts are already provided by the compiled bundle.
+        """
+        from panel.io.compile import generate_project
+
+        hot_dir = pathlib.Path(cls._hot_build_dir).absolute() / 'hot' / cls.__name__
+        hot_dir.mkdir(parents=True, exist_ok=True)
+        generate_project([cls], hot_dir)
+        build_cmd = [
+            'esbuild', 'index.js', '--bundle', '--format=esm', '--loader:.js=jsx',
+            '--loader:.css=empty', '--loader:.woff=empty', '--loader:.woff2=empty',
+        ]
+        result = subprocess.run(build_cmd, cwd=hot_dir, capture_output=True, text=True)
+        if result.returncode:
+            raise RuntimeError(f'Compiling {cls.__name__} failed:\n{result.stderr}')
+        return result.stdout
+
+    @classmethod
+    async def _compile_hot_esm_async(cls) -> None:
+        """
+        Compiles the hot module in a thread, so esbuild does not block the
+        event loop, the result is cached for the next call to _hot_esm.
+        The watchers of all instances of a component share the compilation.
+        """
+        future = cls._hot_futures.get(cls)
+        if future is None:
+            future = cls._hot_futures[cls] = asyncio.get_running_loop().run_in_executor(None, cls._hot_esm)
+            future.add_done_callback(lambda _: cls._hot_futures.pop(cls, None))
+        await future
+
+    @classmethod
+    def _hot_esm(cls) -> tuple[str, str] | None:
+        """
+        Returns the hot module of the component and its hash if hot
+        swapping is enabled and the component source was edited after
+        the bundle was last compiled.
+        """
+        if not (cls._hot_build_dir and config.autoreload and cls._esm_base):
+            return None
+        source = cls._esm_path(compiled='compiling').stat()
+        bundle = pathlib.Path(cls._bundle)
+        if bundle.is_file() and bundle.stat().st_mtime_ns >= source.st_mtime_ns:
+            return None
+        key = (source.st_mtime_ns, source.st_size)
+        cached = cls._hot_cache.get(cls)
+        if cached and cached[0] == key:
+            return cached[1]
+        try:
+            esm = cls._compile_hot_esm()
+        except (OSError, RuntimeError) as e:
+            cls.param.warning(f'Hot swapping {cls.__name__} failed, keeping the previous version. {e}')
+            return cached[1] if cached else None
+        hot = (esm, hashlib.sha256(esm.encode('utf-8')).hexdigest())
+        cls._hot_cache[cls] = (key, hot)
+        return hot
+
+    @classmethod
+    def _bundle_importmap(cls) -> dict[str, Any]:
+        """
+        The importmap sent with bundled components. A bundle resolves all
+        imports itself, the client only inspects the importmap to decide
+        whether the component needs an emotion style cache for MUI.
+        """
+        imports = cls._process_importmap()['imports']
+        return {'imports': {spec: url for spec, url in imports.items() if spec == '@mui/material/'}}
+
+    @classmethod
+    def _compact_data_model(cls):
+        """
+        Declares the class constants as the default of the data model.
+        Bokeh only serializes properties which differ from their default,
+        so the constants are shipped once with the model definition
+        rather than with every instance.
+        """
+        if cls in cls._compact_data_models:
+            return
+        cls._data_model.lookup('esm_constants').property._default = dict(cls._constants)
+        cls._compact_data_models.add(cls)
+
+    @classmethod
+    def _invalidate_esm_cache(cls, paths: set[pathlib.Path] | None = None):
+        """
+        Drops cached ESM renders, either all of them or only those
+        rendered from one of the supplied source paths.
+        """
+        if paths is None:
+            cls._esm_cache.clear()
+            return
+        for component in list(cls._esm_cache):
+            if component._esm_path(compiled='compiling') in paths:
+                cls._esm_cache.pop(component, None)
 
     @classmethod
     def _render_esm_base(cls):
-        esm_base = (pathlib.Path(inspect.getfile(cls)).parent / cls._esm_base).read_text()
+        esm_path = cls._esm_path(compiled='compiling')
+        cached = cls._esm_cache.get(cls)
+        transforms = tuple(cls._esm_transforms or ())
+        if cached and cached[0][-1] == transforms and not config.autoreload:
+            # Sources only change during development, skip the stat
+            return cached[1]
+        stat = esm_path.stat()
+        key = (stat.st_mtime_ns, stat.st_size, transforms)
+        if cached and cached[0] == key:
+            return cached[1]
+        esm = cls._transform_esm(esm_path.read_text())
+        cls._esm_cache[cls] = (key, esm)
+        return esm
+
+    @classmethod
+    def _transform_esm(cls, esm_base: str) -> str:
         if not cls._esm_transforms:
             return esm_base
 
@@ -195,8 +555,14 @@ class MaterialComponent(ReactComponent):
     @classmethod
     def _render_esm(cls, compiled: bool | Literal['compiling'] = True, server: bool = False):
         if compiled != 'compiling':
-            if compiled and __version__ == base_version(__version__):
-                return CDN_DIST
+            if compiled and server and cls._dist_route:
+                from .server import dist_url
+                return dist_url(cls._chunk_path or cls._bundle)
+            elif compiled and __version__ == base_version(__version__):
+                chunk_path = cls._chunk_path
+                if chunk_path is None:
+                    return CDN_DIST
+                return f'{CDN_BASE}chunks/{chunk_path.name}'
             else:
                 return super()._render_esm(compiled=True, server=server)
         elif cls._esm_base is None:
@@ -204,8 +570,39 @@ class MaterialComponent(ReactComponent):
         return cls._render_esm_base()
 
     def _get_properties(self, doc: Document | None) -> dict[str, Any]:
+        self._compact_data_model()
         props = super()._get_properties(doc)
-        if props['esm'] == CDN_DIST:
+        # The bundle only depends on whether the document is served, it
+        # is restored from here once a hot module is replaced, see _update_esm
+        is_session = bool(doc and doc.session_context and doc.session_context.server_context)
+        self._bundle_props[is_session] = {prop: props[prop] for prop in ('bundle', 'css_bundle')}
+        self._resolve_bundle(props)
+        return props
+
+    def _resolve_bundle(self, props: dict[str, Any]) -> None:
+        """
+        Points the esm, bundle, css_bundle and importmap properties
+        at the hot module, the CDN or the self-hosted dist route.
+        """
+        hot = self._hot_esm()
+        esm = props['esm']
+        if hot is not None:
+            # The client caches compiled modules by the bundle key
+            props['esm'], props['bundle'] = hot
+        elif esm == CDN_DIST:
             props['bundle'] = 'url'
             props['css_bundle'] = CDN_DIST.replace('.js', '.css')
-        return props
+        elif esm.startswith(CDN_BASE):
+            props['bundle'] = 'url'
+            chunk_path = self._chunk_path
+            if chunk_path and chunk_path.with_suffix('.css').is_file():
+                props['css_bundle'] = esm.replace('.js', '.css')
+            else:
+                props['css_bundle'] = None
+        elif self._dist_route and f'/{self._dist_route}/' in esm:
+            from .server import bundle_css_variant, dist_url
+            props['bundle'] = 'url'
+            css_path = (self._chunk_path or self._bundle).with_suffix('.css')
+            props['css_bundle'] = dist_url(css_path, bundle_css_variant()) if css_path.is_file() else None
+        if props['bundle'] is not None:
+            props['importmap'] = self._bundle_importmap()
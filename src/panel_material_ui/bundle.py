@@ -0,0 +1,15 @@
+"""
+Eagerly imports all components.
+
+The top-level package imports its components lazily, which hides them
+from tools that discover components by scanning a module namespace.
+Point those tools at this module instead, e.g.:
+
+    panel compile panel_material_ui.bundle --file-loader woff woff2
+"""
+from .base import COLORS, MaterialComponent, ThemedTransform  # noqa
+from .layout import *  # noqa
+from .pane import *  # noqa
+from .template import *  # noqa
+from .theme import MaterialDesign  # noqa
+from .widgets import *  # noqa
@@ -0,0 +1,167 @@
+"""
+Utilities to determine which Material Icons an application uses and to
+build a font containing only those icons.
+
+The full Material Icons font weighs in at hundreds of kilobytes, while
+most applications only render a handful of icons. The icons used by
+a set of components can be collected with `collect_icons` and a font
+subset containing only the ligatures for those icons generated with
+`subset_icon_font`.
+"""
+from __future__ import annotations
+
+import io
+import pathlib
+import re
+from typing import TYPE_CHECKING, Iterable
+
+from .base import BASE_PATH, MaterialComponent
+
+if TYPE_CHECKING:
+    from fontTools.ttLib import TTFont
+    from panel.viewable import Viewable
+
+# Parameters which hold an icon name on Material components
+ICON_PARAMETERS = ('icon', 'active_icon')
+
+# Material Icons ligature names, e.g. "home" or "arrow_back"
+ICON_NAME_RE = re.compile(r'^[a-z0-9_]+$')
+
+# Icons rendered from hardcoded names in the component sources
+_JSX_ICON_RE = re.compile(r'<Icon[^>]*>\s*([a-z0-9_]+)\s*</Icon>')
+
+
+def _icon_names(value) -> Iterable[str]:
+    if isinstance(value, str):
+        if ICON_NAME_RE.match(value):
+            yield value
+    elif isinstance(value, dict):
+        yield from _icon_names(value.get('icon'))
+    elif isinstance(value, list):
+        for item in value:
+            yield from _icon_names(item)
+
+
+def collect_icons(*objects: Viewable) -> list[str]:
+    """
+    Collects the names of all Material Icons used by the supplied
+    objects and any Material components they contain.
+
+    SVG icons are ignored since they do not depend on the icon font.
+
+    Arguments
+    ---------
+    objects: Viewable
+        The components or layouts to collect icons from.
+
+    Returns
+    -------
+    icons: list[str]
+        The sorted list of icon names.
+    """
+    icons = set()
+    sources = set()
+    for obj in objects:
+        for component in obj.select(MaterialComponent):
+            for pname in ICON_PARAMETERS:
+                if pname in component.param:
+                    icons.update(_icon_names(getattr(component, pname)))
+            if 'items' in component.param:
+                items = component.items or []
+                icons.update(_icon_names([item for item in items if isinstance(item, dict)]))
+            if component._esm_base:
+                sources.add(component._esm_path(compiled='compiling'))
+    for source in sources:
+        icons.update(_JSX_ICON_RE.findall(source.read_text()))
+    return sorted(icons)
+
+
+def icon_font_path() -> pathlib.Path:
+    """
+    Returns the path of the (filled) Material Icons font shipped in the dist directory.
+    """
+    fonts = sorted((BASE_PATH / 'dist').glob('material-icons-*.woff2'))
+    for font in fonts:
+        if not any(variant in font.name for variant in ('outlined', 'round', 'sharp', 'two-tone')):
+            return font
+    raise FileNotFoundError('Could not find the Material Icons font in the dist directory.')
+
+
+def _icon_ligatures(font: TTFont, icons: Iterable[str]) -> dict[str, str]:
+    """
+    Maps the icon names to the names of their ligature glyphs
+    as defined by the ligature substitutions of the font.
+    """
+    cmap = font.getBestCmap()
+    sequences = {}
+    for icon in icons:
+        glyphs = tuple(cmap.get(ord(c)) for c in icon)
+        if None not in glyphs:
+            sequences[glyphs] = icon
+    ligatures = {}
+    gsub = font['GSUB'].table if 'GSUB' in font else None
+    for lookup in (gsub.LookupList.Lookup if gsub and gsub.LookupList else []):
+        for subtable in lookup.SubTable:
+            if lookup.LookupType == 7:
+                subtable = subtable.ExtSubTable
+            if subtable.LookupType != 4:
+                continue
+            for first, ligs in subtable.ligatures.items():
+                for lig in ligs:
+                    icon = sequences.get((first, *lig.Component))
+                    if icon is not None:
+                        ligatures.setdefault(icon, lig.LigGlyph)
+    return ligatures
+
+
+def subset_icon_font(
+    icons: Iterable[str], font_path: str | pathlib.Path | None = None, flavor: str = 'woff2'
+) -> bytes:
+    """
+    Generates a Material Icons font which only contains the glyphs
+    for the supplied icon names. Requires the fonttools package.
+
+    The icons are resolved through ligatures, i.e. the font maps the
+    character sequence of an icon name to its glyph. The font is
+    subsetted to the ligature glyphs of the icons and the characters
+    spelling them, without the closure over the ligature lookups, so
+    other icons spelled with the same characters are not retained.
+    Icons the font has no ligature for are ignored.
+
+    Arguments
+    ---------
+    icons: Iterable[str]
+        The icon names to retain.
+    font_path: str | pathlib.Path | None
+        The font to subset, defaults to the bundled Material Icons font.
+    flavor: str
+        The font flavor to generate, either 'woff2' or 'woff'.
+
+    Returns
+    -------
+    font: bytes
+        The subsetted font.
+    """
+    from fontTools import subset
+    from fontTools.ttLib import TTFont
+
+    icons = sorted(set(icons))
+    invalid = [icon for icon in icons if not ICON_NAME_RE.match(icon)]
+    if invalid:
+        raise ValueError(f'Invalid Material Icons names: {invalid}')
+    font = TTFont(font_path or icon_font_path())
+    options = subset.Options()
+    options.flavor = flavor
+    options.layout_features = ['liga']
+    options.layout_closure = False
+    ligatures = _icon_ligatures(font, icons)
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(
+        glyphs=list(ligatures.values()),
+        unicodes={ord(c) for icon in ligatures for c in icon}
+    )
+    subsetter.subset(font)
+    buffer = io.BytesIO()
+    font.flavor = flavor
+    font.save(buffer)
+    return buffer.getvalue()
@@ -0,0 +1,323 @@
+"""
+Self-hosted serving of the compiled panel-material-ui bundles.
+
+Registering the routes of this module switches all Material components
+to load their JS and CSS bundles from a content-hashed route on the
+Panel server instead of the CDN, which allows browsers to cache them
+indefinitely. Additionally the routes serve Material Icons fonts
+subsetted to the icons an application actually uses (see
+`icon_font_stylesheet`). Register the routes either as a plugin:
+
+    panel serve app.py --plugins panel_material_ui.server
+
+or by passing them to `pn.serve`:
+
+    pn.serve(app, extra_patterns=panel_material_ui.server.enable_self_hosting())
+
+Importing the module alone never changes the URLs of the bundles.
+"""
+from __future__ import annotations
+
+import hashlib
+import mimetypes
+import os
+import pathlib
+import re
+from functools import lru_cache
+from typing import Iterable
+from urllib.parse import urljoin
+
+from panel.config import config
+from panel.io.state import state
+from tornado.web import HTTPError, RequestHandler, StaticFileHandler
+
+from .base import BASE_PATH, MaterialComponent
+from .icons import icon_font_path, subset_icon_font
+
+DIST_PATH = BASE_PATH / "dist"
+DIST_ROUTE = "panel_material_ui/dist"
+ICON_ROUTE = "panel_material_ui/icons"
+
+# One year, the de-facto maximum honored by browsers
+IMMUTABLE_MAX_AGE = 365 * 24 * 60 * 60
+
+# Precompressed variants written at build time, in order of preference
+PRECOMPRESSED = (('br', '.br'), ('gzip', '.gz'))
+
+# Filenames rewritten by dist_url, e.g. panel-material-ui.bundle.<hash>.js
+_HASHED_RE = re.compile(r'^(?P<stem>.+)\.(?P<digest>[0-9a-f]{16})(?P<ext>\.[\w]+)$')
+
+# Chunks and assets emitted by esbuild already carry a content hash
+_ESBUILD_HASHED_RE = re.compile(r'-[A-Z0-9]{8}\.[\w]+$')
+
+# Icon sets the server generated URLs for, only these are subsetted
+_ICON_SETS: set[tuple[str, ...]] = set()
+
+# Stylesheet variant without the full Material Icons font, served to
+# pages which declare a subsetted font (see icon_font_stylesheet)
+NO_ICONS_VARIANT = 'noicons'
+
+# The @font-face rules of the (filled) Material Icons font in the bundle CSS
+_ICON_FACE_RE = re.compile(r'''@font-face\s*\{[^}]*font-family:\s*(["']?)Material Icons\1\s*;[^}]*\}\s*''')
+
+
+@lru_cache(maxsize=256)
+def _file_hash(path: str, mtime_ns: int, size: int) -> str:
+    return hashlib.sha256(pathlib.Path(path).read_bytes()).hexdigest()[:16]
+
+
+def content_hash(path: str | os.PathLike) -> str:
+    """
+    Returns a short hash of the file contents, which is cached
+    until the file is modified.
+    """
+    stat = os.stat(path)
+    return _file_hash(str(path), stat.st_mtime_ns, stat.st_size)
+
+
+def accepted_encodings(header: str) -> set[str]:
+    """
+    Parses an Accept-Encoding header into the set of acceptable encodings.
+    """
+    encodings = set()
+    for item in header.split(','):
+        encoding, *params = (part.strip() for part in item.split(';'))
+        quality = next((p[2:] for p in params if p.startswith('q=')), '1')
+        try:
+            weight = float(quality)
+        except ValueError:
+            weight = 0
+        if encoding and weight > 0:
+            encodings.add(encoding.lower())
+    return encodings
+
+
+def _route_prefix() -> str:
+    return f'{state.rel_path}/' if state.rel_path else './'
+
+
+# Bounded by the registered icon sets, see icon_font_url
+@lru_cache(maxsize=None)
+def _icon_font(font_path: str, digest: str, icons: tuple[str, ...], flavor: str) -> bytes:
+    return subset_icon_font(icons, font_path, flavor=flavor)
+
+
+def icon_font_url(icons: Iterable[str], flavor: str = 'woff2') -> str:
+    """
+    Returns the URL of a Material Icons font subsetted to the supplied
+    icons and registers the icon set, the server only generates fonts
+    for registered icon sets.
+    """
+    digest = content_hash(icon_font_path())
+    icons = tuple(sorted(set(icons)))
+    _ICON_SETS.add(icons)
+    names = ','.join(icons)
+    return f'{_route_prefix()}{ICON_ROUTE}/{digest}/{names}.{flavor}'
+
+
+def icon_font_stylesheet(icons: Iterable[str], flavor: str = 'woff2') -> str:
+    """
+    Returns a stylesheet declaring the Material Icons font face using a
+    font subsetted to the supplied icons, to be added to the page via
+    `pn.config.global_css`:
+
+        pn.config.global_css = [icon_font_stylesheet(collect_icons(app))]
+
+    Pages declaring it load the bundle stylesheets without the full
+    font face, so the full font is never fetched.
+    """
+    return (
+        "@font-face {\n"
+        "  font-family: 'Material Icons';\n"
+        "  font-style: normal;\n"
+        "  font-weight: 400;\n"
+        "  font-display: block;\n"
+        f"  src: url({icon_font_url(icons, flavor)}) format('{flavor}');\n"
+        "}"
+    )
+
+
+def icon_subset_declared() -> bool:
+    """
+    Whether the current page declares a subsetted icon font, i.e. a
+    stylesheet returned by `icon_font_stylesheet` is in the global_css.
+    """
+    return any(f'/{ICON_ROUTE}/' in css for css in config.global_css)
+
+
+def bundle_css_variant() -> str | None:
+    """
+    Returns the variant of the bundle stylesheets to load, pages which
+    declare a subsetted icon font must not also declare the full font.
+    """
+    return NO_ICONS_VARIANT if icon_subset_declared() else None
+
+
+def dist_url(path: str | os.PathLike, variant: str | None = None) -> str:
+    """
+    Returns the URL of a file in the dist directory with the
+    content hash (preceded by the variant if any) inserted before
+    the file extension.
+    """
+    path = pathlib.Path(path)
+    infix = f'.{variant}' if variant else ''
+    rel_path = path.relative_to(DIST_PATH).with_suffix(f'{infix}.{content_hash(path)}{path.suffix}')
+    return f'{_route_prefix()}{DIST_ROUTE}/{rel_path.as_posix()}'
+
+
+def session_dist_url(path: str | os.PathLike, variant: str | None = None) -> str | None:
+    """
+    Returns the absolute URL of a file in the dist directory for the
+    page of the current server session, or None outside a session.
+    """
+    session_context = state.curdoc.session_context if state.curdoc else None
+    request = getattr(session_context, 'request', None)
+    if request is None:
+        return None
+    return urljoin(request.full_url(), dist_url(path, variant))
+
+
+@lru_cache(maxsize=64)
+def _strip_icon_faces(path: str, digest: str) -> str:
+    return _ICON_FACE_RE.sub('', pathlib.Path(path).read_text())
+
+
+class DistHandler(StaticFileHandler):
+    """
+    Serves the files in the dist directory. Content-hashed requests
+    are validated against the current file contents and answered with
+    long-lived `immutable` caching headers, all other requests have to
+    be revalidated by the browser. If the client accepts it a brotli or
+    gzip compressed variant generated at build time is served instead.
+    """
+
+    def initialize(self, path: str | os.PathLike = DIST_PATH, default_filename: str | None = None) -> None:
+        super().initialize(str(path), default_filename)
+        self._immutable = False
+        self._digest: str | None = None
+        self._encoding: tuple[str, str] | None = None
+
+    def parse_url_path(self, url_path: str) -> str:
+        match = _HASHED_RE.match(url_path)
+        if match:
+            # The digest is checked once the path is validated to be
+            # a file inside the root, see validate_absolute_path
+            self._digest = match.group('digest')
+            self._immutable = True
+            return super().parse_url_path(match.group('stem') + match.group('ext'))
+        self._immutable = bool(_ESBUILD_HASHED_RE.search(url_path))
+        return super().parse_url_path(url_path)
+
+    def validate_absolute_path(self, root: str, absolute_path: str) -> str | None:
+        absolute_path = super().validate_absolute_path(root, absolute_path)
+        if absolute_path is None:
+            return None
+        if self._digest is not None and content_hash(absolute_path) != self._digest:
+            raise HTTPError(404, 'Requested file version is not available.')
+        accepted = accepted_encodings(self.request.headers.get('Accept-Encoding', ''))
+        for encoding, suffix in PRECOMPRESSED:
+            compressed = absolute_path + suffix
+            if encoding in accepted and os.path.isfile(compressed):
+                self._encoding = (encoding, suffix)
+                # Size and modification time must describe the file we send
+                self._stat_result = os.stat(compressed)
+                return compressed
+        return absolute_path
+
+    def get_content_type(self) -> str:
+        if self._encoding is None:
+            return super().get_content_type()
+        mime_type, _ = mimetypes.guess_type(self.absolute_path[:-len(self._encoding[1])])
+        return mime_type or 'application/octet-stream'
+
+    def get_cache_time(self, path: str, modified, mime_type: str) -> int:
+        return IMMUTABLE_MAX_AGE if self._immutable else 0
+
+    def set_extra_headers(self, path: str) -> None:
+        self.set_header('Vary', 'Accept-Encoding')
+        if self._encoding is not None:
+            self.set_header('Content-Encoding', self._encoding[0])
+        if self._immutable:
+            self.set_header('Cache-Control', f'public, max-age={IMMUTABLE_MAX_AGE}, immutable')
+        else:
+            self.set_header('Cache-Control', 'no-cache')
+
+
+class NoIconsCSSHandler(RequestHandler):
+    """
+    Serves a stylesheet of the dist directory without the @font-face
+    rules of the full Material Icons font, for pages which declare a
+    subsetted icon font instead:
+
+    /<DIST_ROUTE>/<path>.noicons.<hash>.css
+
+    The stylesheet is served from the same directory as the original,
+    so relative URLs in it still resolve.
+    """
+
+    def get(self, path: str, digest: str) -> None:
+        root = pathlib.Path(DIST_PATH).resolve()
+        css_path = (root / f'{path}.css').resolve()
+        if root not in css_path.parents or not css_path.is_file():
+            raise HTTPError(404)
+        if content_hash(css_path) != digest:
+            raise HTTPError(404, 'Requested file version is not available.')
+        self.set_header('Content-Type', 'text/css; charset=UTF-8')
+        self.set_header('Cache-Control', f'public, max-age={IMMUTABLE_MAX_AGE}, immutable')
+        self.write(_strip_icon_faces(str(css_path), digest))
+
+
+class IconFontHandler(RequestHandler):
+    """
+    Serves Material Icons fonts subsetted to the icons listed in the URL:
+
+    /<ICON_ROUTE>/<font hash>/<icon>,<icon>,....<woff2|woff>
+
+    The URL fully determines the content, so the response is cached
+    indefinitely. Only icon sets registered by `icon_font_url` are
+    served, so clients cannot trigger arbitrary subsetting runs.
+    """
+
+    def get(self, digest: str, names: str, flavor: str) -> None:
+        try:
+            font_path = icon_font_path()
+        except FileNotFoundError:
+            raise HTTPError(404) from None
+        if content_hash(font_path) != digest:
+            raise HTTPError(404, 'Requested font version is not available.')
+        icons = tuple(sorted(set(names.split(','))))
+        if icons not in _ICON_SETS:
+            raise HTTPError(404, 'Requested icon set is not available.')
+        try:
+            font = _icon_font(str(font_path), digest, icons, flavor)
+        except ValueError as e:
+            raise HTTPError(400, str(e)) from None
+        self.set_header('Content-Type', f'font/{flavor}')
+        self.set_header('Cache-Control', f'public, max-age={IMMUTABLE_MAX_AGE}, immutable')
+        self.write(font)
+
+
+_ROUTES = [
+    (rf'/{DIST_ROUTE}/(.+)\.{NO_ICONS_VARIANT}\.([0-9a-f]{{16}})\.css', NoIconsCSSHandler, {}),
+    (rf'/{DIST_ROUTE}/(.*)', DistHandler, {}),
+    (rf'/{ICON_ROUTE}/([0-9a-f]{{16}})/([a-z0-9_,]+)\.(woff2|woff)', IconFontHandler, {}),
+]
+
+
+def enable_self_hosting() -> list[tuple[str, type[RequestHandler], dict]]:
+    """
+    Switches all Material components to load their bundles from the
+    dist route of the Panel server and returns the routes serving the
+    bundles and the subsetted icon fonts, which must be registered
+    with the server.
+    """
+    MaterialComponent._dist_route = DIST_ROUTE
+    return list(_ROUTES)
+
+
+def __getattr__(name: str):
+    # `panel serve --plugins panel_material_ui.server` registers the
+    # ROUTES of the module, which is when self-hosting is enabled
+    if name == 'ROUTES':
+        return enable_self_hosting()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
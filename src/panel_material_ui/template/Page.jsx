@@ -61,13 +61,19 @@ export function render({model}) {
   const [title] = model.useState("title")
   const [open, setOpen] = model.useState("sidebar_open")
   const [variant] = model.useState("sidebar_variant")
+  const [theme_model] = model.useState("theme")
   const [dark_theme, setDarkTheme] = model.useState("dark_theme")
+  const dark_mode = theme.palette.mode === "dark"
 
   const toggleOpen = () => {
     setOpen(!open);
   }
   const toggleTheme = () => {
-    setDarkTheme(!dark_theme)
+    // Toggling the shared theme updates all components with one message
+    theme_model.setv({dark_theme: !dark_mode})
+    if (dark_theme != null) {
+      setDarkTheme(!dark_mode)
+    }
   }
 
   const drawer = (
@@ -113,7 +119,7 @@ export function render({model}) {
             {model.get_child("header")}
           </Box>
           <IconButton onClick={toggleTheme} color="inherit" align="right">
-            {dark_theme ? <DarkMode /> : <LightMode />}
+            {dark_mode ? <DarkMode /> : <LightMode />}
           </IconButton>
         </Toolbar>
       </AppBar>
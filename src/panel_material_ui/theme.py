@@ -1,8 +1,16 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, ClassVar
+from weakref import WeakKeyDictionary
+
+import bokeh.core.properties as bp
 import param
+from bokeh.model import DataModel
 from bokeh.themes import Theme as _BkTheme
 from panel.config import config
+from panel.io.state import state
+from panel.reactive import Syncable
 from panel.theme import DarkTheme, DefaultTheme, Native
 from panel.theme.material import (
     MATERIAL_DARK_THEME,
@@ -10,6 +18,12 @@ from panel.theme.material import (
 )
 from panel.widgets import Tabulator
 
+if TYPE_CHECKING:
+    from bokeh.document import Document
+    from bokeh.model import Model
+    from bokeh.server.contexts import BokehSessionContext
+    from pyviz_comms import Comm
+
 
 class MaterialLight(DefaultTheme):
 
@@ -38,4 +52,133 @@ class MaterialDesign(Native):
     _themes = {'dark': MaterialDark, 'default': MaterialLight}
 
 
+class _BkDocumentTheme(DataModel):
+
+    dark_theme = bp.Bool(default=False)
+
+    theme_config = bp.Nullable(bp.Dict(bp.String, bp.Any))
+
+
+class DocumentTheme(Syncable):
+    """
+    The theme shared by all Material components rendered in a document.
+
+    Components reference a single model of the theme per document, so
+    changing the theme is synced with one message, independent of the
+    number of components, and components carry no copy of the theme.
+    Components may override the `dark_theme` and `theme_config` of the
+    theme individually.
+
+    :Example:
+
+    >>> DocumentTheme.for_document().dark_theme = True
+    """
+
+    dark_theme = param.Boolean(default=False, allow_refs=True, doc="""
+        Whether to use the dark mode palette.""")
+
+    theme_config = param.Dict(default=None, allow_refs=True, nested_refs=True, doc="""
+        Options to configure the ThemeProvider.""")
+
+    _rename: ClassVar[Mapping[str, str | None]] = {'name': None}
+
+    # Global theme, e.g. for the notebook context
+    _global: ClassVar[DocumentTheme | None] = None
+
+    # Server themes indexed by document
+    _document_themes: ClassVar[WeakKeyDictionary[Document, DocumentTheme]] = WeakKeyDictionary()
+
+    def __init__(self, **params):
+        super().__init__(**params)
+        self._document_models: WeakKeyDictionary[Document, Model] = WeakKeyDictionary()
+        # Refs of the component models using the theme, indexed by root
+        self._users: dict[str, set[str]] = {}
+
+    @classmethod
+    def for_document(cls, doc: Document | None = None) -> DocumentTheme:
+        """
+        Returns the theme of a server session, creating it if necessary.
+        Documents outside a server session, e.g. in a notebook, share a
+        global theme.
+
+        Arguments
+        ---------
+        doc: Document | None
+            The document, defaults to the current document.
+
+        Returns
+        -------
+        theme: DocumentTheme
+            The theme shared by all components in the document.
+        """
+        doc = doc or state.curdoc
+        if doc is None or doc.session_context is None:
+            if cls._global is None:
+                cls._global = cls(dark_theme=config.theme == 'dark')
+            return cls._global
+        if doc not in cls._document_themes:
+            cls._document_themes[doc] = cls(dark_theme=config.theme == 'dark')
+            doc.on_session_destroyed(cls._destroy_document_theme)
+        return cls._document_themes[doc]
+
+    @classmethod
+    def _destroy_document_theme(cls, session_context: BokehSessionContext) -> None:
+        cls._document_themes.pop(session_context._document, None)
+
+    def _get_model(
+        self, doc: Document, root: Model | None = None,
+        parent: Model | None = None, comm: Comm | None = None
+    ) -> Model:
+        # All roots in a document share the model, which is linked once
+        model = self._document_models.get(doc)
+        if model is None:
+            model = _BkDocumentTheme(**self._process_param_change(self._init_params()))
+            root = root or model
+            self._document_models[doc] = model
+            self._models[root.ref['id']] = (model, parent)
+            self._link_props(model, self._linked_properties, doc, root, comm)
+            if doc.session_context:
+                doc.on_session_destroyed(self._server_destroy)
+        if root is not None and parent is not None:
+            self._users.setdefault(root.ref['id'], set()).add(parent.ref['id'])
+        return model
+
+    def _release(self, root: Model, parent: Model) -> None:
+        """
+        Releases the model used by a component, cleaning it up once no
+        component rendered under the root uses it.
+        """
+        ref = root.ref['id']
+        users = self._users.get(ref, set())
+        users.discard(parent.ref['id'])
+        if not users:
+            self._users.pop(ref, None)
+            self._cleanup(root)
+
+    def _cleanup(self, root: Model | None = None) -> None:
+        if root is None or root.ref['id'] not in self._models:
+            super()._cleanup(root)
+            return
+        model, parent = self._models[root.ref['id']]
+        super()._cleanup(root)
+        # Relink the model to another root of the document still using it
+        for ref in self._users:
+            if ref in state._views and self._document_models.get(state._views[ref][2]) is model:
+                _, other, doc, comm = state._views[ref]
+                self._models[ref] = (model, parent)
+                self._link_props(model, self._linked_properties, doc, other, comm)
+                return
+        for doc, doc_model in list(self._document_models.items()):
+            if doc_model is model:
+                del self._document_models[doc]
+
+    def _server_destroy(self, session_context: BokehSessionContext) -> None:
+        doc = session_context._document
+        model = self._document_models.pop(doc, None)
+        for ref, (ref_model, _) in list(self._models.items()):
+            if ref_model is model:
+                del self._models[ref]
+                self._users.pop(ref, None)
+                ref_model._callbacks = {}
+
 config.design = MaterialDesign
@@ -2,10 +2,56 @@ import TextField from "@mui/material/TextField"
 import Autocomplete from "@mui/material/Autocomplete"
 import Popper from "@mui/material/Popper"
 
-export function render({model, el}) {
+// Number of queries whose server-side completions are cached
+const CACHE_SIZE = 100
+
+// Views tag their queries with ids of their own, so views created
+// later do not reuse the ids of an existing view
+let view_count = 0
+
+class CompletionCache {
+  // Least recently used entries are evicted first, Map preserves the
+  // insertion order so the first key is always the oldest entry.
+  constructor(size) {
+    this.size = size
+    this.entries = new Map()
+  }
+
+  get(key) {
+    const entry = this.entries.get(key)
+    if (entry !== undefined) {
+      this.entries.delete(key)
+      this.entries.set(key, entry)
+    }
+    return entry
+  }
+
+  set(key, entry) {
+    this.entries.delete(key)
+    if (this.entries.size >= this.size) {
+      this.entries.delete(this.entries.keys().next().value)
+    }
+    this.entries.set(key, entry)
+  }
+
+  clear() {
+    this.entries.clear()
+  }
+}
+
+export function render({model, el, view}) {
   const [value, setValue] = model.useState("value")
   const [value_input, setValueInput] = model.useState("value_input")
-  const [options] = model.useState("options")
+  const options = usePatchedOptions(model)
+  const [completions] = model.useState("completions")
+  const [completions_query] = model.useState("completions_query")
+  const [completer] = model.useState("completer")
+  const [case_sensitive] = model.useState("case_sensitive")
+  const [min_characters] = model.useState("min_characters")
+  const [query_id] = model.useState("query_id")
+  const [search_mode] = model.useState("search_mode")
+  const [search_option_limit] = model.useState("search_option_limit")
+  const [search_strategy] = model.useState("search_strategy")
   const [label] = model.useState("label")
   const [placeholder] = model.useState("placeholder")
   const [restrict] = model.useState("restrict")
@@ -16,25 +62,106 @@ export function render({model, el}) {
     return <Popper {...props} container={el} />
   }
 
-  const filt_func = (options, state) => {
+  const server = search_mode === "server"
+
+  const cache = React.useRef(null)
+  if (cache.current === null) {
+    cache.current = new CompletionCache(CACHE_SIZE)
+  }
+  const normalize = (text) => case_sensitive ? text : text.toLowerCase()
+
+  React.useEffect(() => {
+    // The server invalidates the cache whenever the options or the
+    // search settings change
+    const onMsg = (msg) => {
+      if (msg.type === "invalidate") {
+        cache.current.clear()
+      }
+    }
+    model.on("msg:custom", onMsg)
+    return () => model.off("msg:custom", onMsg)
+  }, [])
+
+  const cached = (query) => {
+    const key = normalize(query)
+    const entry = cache.current.get(key)
+    if (entry !== undefined || search_strategy !== "starts_with" || completer) {
+      return entry?.results
+    }
+    // Results for a prefix which were not truncated contain all
+    // matches of the longer query, so they can be refined locally
+    for (let i = key.length - 1; i >= min_characters; i--) {
+      const broader = cache.current.get(key.slice(0, i))
+      if (broader?.complete) {
+        const results = broader.results.filter((opt) => normalize(opt).startsWith(key))
+        cache.current.set(key, {results, complete: true})
+        return results
+      }
+    }
+    return undefined
+  }
+
+  const view_id = React.useRef(null)
+  if (view_id.current === null) {
+    view_id.current = `${view.model.id}-${++view_count}`
+  }
+  const latest_query = React.useRef(0)
+  const query_key = () => `${view_id.current}:${latest_query.current}`
+  const [results, setResults] = React.useState(completions)
+  React.useEffect(() => {
+    if (server && completions_query != null && completions_query.length >= min_characters) {
+      cache.current.set(normalize(completions_query), {
+        results: completions,
+        complete: completions.length < search_option_limit,
+      })
+    }
+    // Completions answering an older query or a query of another
+    // view are cached but not displayed, completions looked up on
+    // the server before any query was sent have no id
+    if (query_id == null || query_id === query_key()) {
+      setResults(completions)
+    }
+  }, [completions, completions_query, query_id])
+
+  const search = (query) => {
+    latest_query.current += 1
+    if (query.length < min_characters) {
+      setResults([])
+      return
+    }
+    const hit = cached(query)
+    if (hit === undefined) {
+      model.send_msg({type: "search", query, id: query_key()})
+    } else {
+      setResults(hit)
+    }
+  }
+
+  // Lowercase the options once rather than on every keystroke
+  const lower_options = React.useMemo(() => options.map((opt) => opt.toLowerCase()), [options])
+
+  const filt_func = (opts, state) => {
+    if (server) {
+      // Completions were already matched on the server
+      return opts
+    }
     let input = state.inputValue
-    if (input.length < model.min_characters) {
+    if (input.length < min_characters) {
       return []
     }
-    return options.filter((opt) => {
-      if (!model.case_sensitive) {
-        opt = opt.toLowerCase()
-        input = input.toLowerCase()
-      }
-      return model.search_strategy == "includes" ? opt.includes(input) : opt.startsWith(input)
-    })
+    const keys = case_sensitive ? options : lower_options
+    if (!case_sensitive) {
+      input = input.toLowerCase()
+    }
+    const includes = search_strategy == "includes"
+    return options.filter((opt, i) => includes ? keys[i].includes(input) : keys[i].startsWith(input))
   }
 
   return (
     <Autocomplete
       value={value}
       onChange={(event, newValue) => setValue(newValue)}
-      options={options}
+      options={server ? results : options}
       disabled={disabled}
       freeSolo={!restrict}
       filterOptions={filt_func}
@@ -46,7 +173,12 @@ export function render({model, el}) {
           variant={variant}
           label={label}
           placeholder={placeholder}
-          onChange={(event) => setValueInput(event.target.value)}
+          onChange={(event) => {
+            setValueInput(event.target.value)
+            if (server) {
+              search(event.target.value)
+            }
+          }}
           onKeyDown={(event) => {
             if (event.key === "Enter") {
               model.send_event("enter", event)
@@ -1,7 +1,6 @@
 import Box from "@mui/material/Box";
 import OutlinedInput from "@mui/material/OutlinedInput";
 import InputLabel from "@mui/material/InputLabel";
-import MenuItem from "@mui/material/MenuItem";
 import FormControl from "@mui/material/FormControl";
 import Select from "@mui/material/Select";
 import Chip from "@mui/material/Chip";
@@ -9,6 +8,9 @@ import Chip from "@mui/material/Chip";
 const ITEM_HEIGHT = 48;
 const ITEM_PADDING_TOP = 8;
 
+// Rows in view of the windowed menu
+const VISIBLE_ITEMS = 5;
+
 const MenuProps = {
   disablePortal: true, // Ensures menu doesn't render outside of shadow DOM
   PaperProps: {
@@ -22,8 +24,19 @@ const MenuProps = {
 export function render({model, view}) {
   const [disabled] = model.useState("disabled");
   const [label] = model.useState("label");
-  const [options] = model.useState("options");
+  const options = usePatchedOptions(model);
   const [value, setValue] = model.useState("value");
+  const [virtualize] = model.useState("virtualize");
+  const [open, setOpen] = React.useState(false);
+
+  const menu = useVirtualMenu({
+    options,
+    selected: value?.[0],
+    enabled: virtualize,
+    itemHeight: ITEM_HEIGHT,
+    visibleItems: VISIBLE_ITEMS,
+    menuProps: MenuProps,
+  });
 
   const handleChange = (event) => {
     const {
@@ -42,6 +55,12 @@ export function render({model, view}) {
         multiple
         value={value}
         onChange={handleChange}
+        open={open}
+        onOpen={() => {
+          menu.onOpen();
+          setOpen(true);
+        }}
+        onClose={() => setOpen(false)}
         input={<OutlinedInput label={label} />}
         renderValue={(selected) => (
           <Box sx={{display: "flex", flexWrap: "wrap", gap: 0.5}}>
@@ -50,16 +69,9 @@ export function render({model, view}) {
             ))}
           </Box>
         )}
-        MenuProps={MenuProps}
+        MenuProps={menu.menuProps}
       >
-        {options.map((name) => (
-          <MenuItem
-            key={name}
-            value={name}
-          >
-            {name}
-          </MenuItem>
-        ))}
+        {menu.items}
       </Select>
     </FormControl>
   );
@@ -1,37 +1,53 @@
 import InputLabel from "@mui/material/InputLabel";
-import MenuItem from "@mui/material/MenuItem";
 import FormControl from "@mui/material/FormControl";
 import Select from "@mui/material/Select";
 
+// Rows of the windowed menu have a fixed height
+const ITEM_HEIGHT = 36;
+const VISIBLE_ITEMS = 8;
+
 export function render({model, el}) {
   const [value, setValue] = model.useState("value");
-  const [options] = model.useState("options");
+  const options = usePatchedOptions(model);
   const [label] = model.useState("label");
   const [variant] = model.useState("variant");
   const [disabled] = model.useState("disabled");
   const [disabled_options] = model.useState("disabled_options");
+  const [virtualize] = model.useState("virtualize");
+  const [open, setOpen] = React.useState(false);
+
+  const disabled_set = React.useMemo(() => new Set(disabled_options), [disabled_options]);
+  const menu = useVirtualMenu({
+    options,
+    selected: value,
+    disabled: disabled_set,
+    enabled: virtualize,
+    itemHeight: ITEM_HEIGHT,
+    visibleItems: VISIBLE_ITEMS,
+  });
+
   return (
     <FormControl fullWidth disabled={disabled}>
       {label && <InputLabel>{label}</InputLabel>}
       <Select
         MenuProps={{
           container: el,
+          ...menu.menuProps,
         }}
         disabled={disabled}
+        open={open}
+        onOpen={() => {
+          menu.onOpen();
+          setOpen(true);
+        }}
+        onClose={() => setOpen(false)}
+        renderValue={virtualize ? (selected) => selected : undefined}
         value={value}
         label={label}
         variant={variant}
         onChange={(event) => setValue(event.target.value)}
       >
-        {options.map((option, index) => (
-          <MenuItem
-            key={index}
-            value={option}
-            disabled={disabled_options?.includes(option)}
-          >
-            {option}
-          </MenuItem>
-        ))}
+        {menu.items}
       </Select>
     </FormControl>
   );
@@ -1,6 +1,93 @@
-from .button import *  # noqa
-from .icon import *  # noqa
-from .indicators import *  # noqa
-from .input import *  # noqa
-from .select import *  # noqa
-from .sliders import *  # noqa
+"""
+Material UI widgets.
+
+The widget modules are imported lazily on first attribute access, so
+that using a single widget does not require constructing all of them.
+"""
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+# Maps each public widget to the submodule it is defined in, names
+# starting with a dot are resolved relative to the parent package
+_LAZY_IMPORTS = {
+    'COLORS': '.base',
+    'ThemedTransform': '.base',
+    'MaterialWidget': 'base',
+    'TooltipTransform': 'base',
+    'Button': 'button',
+    'Toggle': 'button',
+    'ButtonIcon': 'icon',
+    'ToggleIcon': 'icon',
+    'LoadingIndicator': 'indicators',
+    'Progress': 'indicators',
+    'Checkbox': 'input',
+    'DatePicker': 'input',
+    'DateRangePicker': 'input',
+    'DatetimePicker': 'input',
+    'DatetimeRangePicker': 'input',
+    'FileInput': 'input',
+    'FloatInput': 'input',
+    'IntInput': 'input',
+    'MaterialInputWidget': 'input',
+    'NumberInput': 'input',
+    'PasswordInput': 'input',
+    'Switch': 'input',
+    'TextAreaInput': 'input',
+    'TextInput': 'input',
+    'TimePicker': 'input',
+    'AutocompleteInput': 'select',
+    'ButtonGroup': 'select',
+    'CheckBoxGroup': 'select',
+    'CheckButtonGroup': 'select',
+    'MaterialMultiSelectBase': 'select',
+    'MaterialSingleSelectBase': 'select',
+    'MultiChoice': 'select',
+    'RadioBoxGroup': 'select',
+    'RadioButtonGroup': 'select',
+    'RadioGroup': 'select',
+    'Select': 'select',
+    'FloatSlider': 'sliders',
+    'IntRangeSlider': 'sliders',
+    'IntSlider': 'sliders',
+    'RangeSlider': 'sliders',
+    'Rating': 'sliders',
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name: str):
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f'.{_LAZY_IMPORTS[name]}', __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+
+if TYPE_CHECKING:
+    from ..base import COLORS, ThemedTransform  # noqa
+    from .base import MaterialWidget, TooltipTransform  # noqa
+    from .button import Button, Toggle  # noqa
+    from .icon import ButtonIcon, ToggleIcon  # noqa
+    from .indicators import LoadingIndicator, Progress  # noqa
+    from .input import (  # noqa
+        Checkbox, DatePicker, DateRangePicker, DatetimePicker,
+        DatetimeRangePicker, FileInput, FloatInput, IntInput,
+        MaterialInputWidget, NumberInput, PasswordInput, Switch,
+        TextAreaInput, TextInput, TimePicker,
+    )
+    from .select import (  # noqa
+        AutocompleteInput, ButtonGroup, CheckBoxGroup, CheckButtonGroup,
+        MaterialMultiSelectBase, MaterialSingleSelectBase, MultiChoice,
+        RadioBoxGroup, RadioButtonGroup, RadioGroup, Select,
+    )
+    from .sliders import (  # noqa
+        FloatSlider, IntRangeSlider, IntSlider, RangeSlider, Rating,
+    )
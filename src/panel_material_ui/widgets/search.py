@@ -0,0 +1,207 @@
+"""
+Indexes for looking up and searching large lists of options on the server.
+"""
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+from functools import cached_property
+from typing import Any, Sequence
+
+from panel.util import indexOf
+
+
+class OptionIndex:
+    """
+    OptionIndex maps the values and labels of a list of options to
+    their position using hash lookups instead of linear scans. Like
+    `panel.util.indexOf` the first matching position is returned, only
+    unhashable values have to be compared one by one.
+
+    The lookups are built lazily and never updated, a new index has to
+    be created whenever the options change.
+    """
+
+    def __init__(self, values: Sequence[Any], labels: Sequence[str] | None = None):
+        self.values = values
+        if labels is not None:
+            self.labels = labels
+
+    @cached_property
+    def unicode_values(self) -> list[str]:
+        return [str(v) for v in self.values]
+
+    @cached_property
+    def labels(self) -> Sequence[str]:
+        return self.unicode_values
+
+    @cached_property
+    def unique(self) -> bool:
+        """
+        Whether the string representations of the values are unique.
+        """
+        return len(set(self.unicode_values)) == len(self.labels)
+
+    @cached_property
+    def items(self) -> dict[str, Any]:
+        return dict(zip(self.labels, self.values, strict=True))
+
+    @staticmethod
+    def _positions(keys: Sequence[Any]) -> dict[Any, int]:
+        positions: dict[Any, int] = {}
+        for i, key in enumerate(keys):
+            positions.setdefault(key, i)
+        return positions
+
+    @cached_property
+    def _value_positions(self) -> tuple[dict[Any, int], list[int]]:
+        positions: dict[Any, int] = {}
+        unhashable = []
+        for i, value in enumerate(self.values):
+            try:
+                positions.setdefault(value, i)
+            except TypeError:
+                unhashable.append(i)
+        return positions, unhashable
+
+    @cached_property
+    def _label_positions(self) -> dict[str, int]:
+        return self._positions(self.labels)
+
+    @cached_property
+    def _unicode_positions(self) -> dict[str, int]:
+        return self._positions(self.unicode_values)
+
+    def index(self, value: Any) -> int | None:
+        """
+        Returns the position of the first option equal to the value.
+        """
+        positions, unhashable = self._value_positions
+        try:
+            position = positions.get(value)
+        except TypeError:
+            # Unhashable values may compare equal to any option
+            try:
+                return indexOf(value, self.values)
+            except ValueError:
+                return None
+        for i in unhashable:
+            if position is not None and i > position:
+                break
+            option = self.values[i]
+            try:
+                if option is value or option == value:
+                    return i
+            except Exception:
+                pass
+        return position
+
+    def label_index(self, label: str) -> int | None:
+        return self._label_positions.get(label)
+
+    def unicode_index(self, text: str) -> int | None:
+        return self._unicode_positions.get(text)
+
+    def __contains__(self, value: Any) -> bool:
+        return self.index(value) is not None
+
+
+class SearchIndex:
+    """
+    SearchIndex answers prefix and substring queries against a fixed
+    list of strings without scanning the whole list.
+
+    Prefix queries bisect a sorted copy of the (normalized) strings and
+    return matches in lexicographic order. Substring queries look up the
+    n-grams of the query in an inverted index and verify the candidates
+    of the rarest n-gram, returning matches in the order of the original
+    strings. Queries shorter than the n-gram size fall back to a scan
+    which stops as soon as enough matches were found.
+
+    Both structures are built lazily on the first query that needs them.
+
+    :Example:
+
+    >>> index = SearchIndex(['Biology', 'Chemistry', 'Physics'], case_sensitive=False)
+    >>> index.search('bio')
+    ['Biology']
+    >>> index.search('ist', strategy='includes')
+    ['Chemistry']
+    """
+
+    def __init__(self, options: Sequence[str], case_sensitive: bool = True, ngram: int = 3):
+        self.options = list(options)
+        self.case_sensitive = case_sensitive
+        self.ngram = ngram
+
+    def _normalize(self, text: str) -> str:
+        return text if self.case_sensitive else text.lower()
+
+    @cached_property
+    def _keys(self) -> list[str]:
+        return [self._normalize(str(option)) for option in self.options]
+
+    @cached_property
+    def _sorted(self) -> tuple[list[str], array]:
+        order = sorted(range(len(self._keys)), key=self._keys.__getitem__)
+        return [self._keys[i] for i in order], array('L', order)
+
+    @cached_property
+    def _postings(self) -> dict[str, array]:
+        n = self.ngram
+        postings: dict[str, array] = {}
+        for i, key in enumerate(self._keys):
+            for gram in {key[j:j+n] for j in range(len(key)-n+1)}:
+                if gram not in postings:
+                    postings[gram] = array('L')
+                postings[gram].append(i)
+        return postings
+
+    def starts_with(self, query: str, limit: int | None = None) -> list[str]:
+        """
+        Returns the options starting with the query in lexicographic order.
+        """
+        query = self._normalize(query)
+        keys, order = self._sorted
+        matches = []
+        for i in range(bisect_left(keys, query), len(keys)):
+            if not keys[i].startswith(query) or len(matches) == limit:
+                break
+            matches.append(self.options[order[i]])
+        return matches
+
+    def includes(self, query: str, limit: int | None = None) -> list[str]:
+        """
+        Returns the options containing the query in their original order.
+        """
+        query = self._normalize(query)
+        keys = self._keys
+        n = self.ngram
+        if len(query) < n:
+            candidates = range(len(keys))
+        else:
+            postings = self._postings
+            grams = {query[j:j+n] for j in range(len(query)-n+1)}
+            if any(gram not in postings for gram in grams):
+                return []
+            candidates = min((postings[gram] for gram in grams), key=len)
+        matches = []
+        for i in candidates:
+            if len(matches) == limit:
+                break
+            if query in keys[i]:
+                matches.append(self.options[i])
+        return matches
+
+    def search(self, query: str, strategy: str = 'starts_with', limit: int | None = None) -> list[str]:
+        """
+        Returns up to `limit` options matching the query using the
+        'starts_with' or 'includes' strategy.
+        """
+        if strategy == 'includes':
+            return self.includes(query, limit)
+        elif strategy == 'starts_with':
+            return self.starts_with(query, limit)
+        raise ValueError(
+            f"Unknown search strategy {strategy!r}, expected 'starts_with' or 'includes'."
+        )
@@ -1,8 +1,14 @@
 from __future__ import annotations
 
+import asyncio
+import inspect
+from typing import TYPE_CHECKING, Any, Iterable
+
 import param
-from panel.util import edit_readonly, isIn
+from panel.io.state import state
+from panel.util import PARAM_NAME_PATTERN, edit_readonly
 from panel.widgets.base import Widget
+from panel.widgets.select import SelectBase as _PnSelectBase
 from panel.widgets.select import (
     SingleSelectBase as _PnSingleSelectBase,
 )
@@ -10,23 +16,415 @@ from panel.widgets.select import (
     _MultiSelectBase as _PnMultiSelectBase,
 )
 
-from ..base import COLORS
+from ..base import COLORS, ESMTransform, ThemedTransform
 from .base import MaterialWidget
+from .search import OptionIndex, SearchIndex
+
+if TYPE_CHECKING:
+    from panel.custom import ReactComponent
+
+
+class _IndexedSelectBase(_PnSelectBase):
+    """
+    Looks up values and labels in an OptionIndex which is rebuilt
+    only when the options change, instead of scanning the options on
+    every change of the value.
+    """
+
+    _option_index: OptionIndex | None = None
+
+    __abstract = True
+
+    def __init__(self, **params):
+        super().__init__(**params)
+        # Runs ahead of the watchers syncing the options to the frontend
+        self._internal_callbacks.append(
+            self.param._watch(self._reset_option_index, 'options', precedence=-1)
+        )
+
+    def _reset_option_index(self, *events):
+        self._option_index = None
+
+    @property
+    def _index(self) -> OptionIndex:
+        if self._option_index is None:
+            labels = self._option_labels(self.options) if isinstance(self.options, list) else super().labels
+            self._option_index = OptionIndex(super().values, labels)
+        return self._option_index
+
+    @staticmethod
+    def _option_labels(options: list[Any]) -> list[str]:
+        # Same labels as SelectBase.labels for a list of options
+        return [
+            option.name if isinstance(option, param.Parameterized) and not PARAM_NAME_PATTERN.match(option.name)
+            else str(option) for option in options
+        ]
+
+    @property
+    def labels(self):
+        return self._index.labels
+
+    @property
+    def values(self):
+        return self._index.values
+
+    @property
+    def unicode_values(self):
+        return self._index.unicode_values
+
+    @property
+    def _items(self):
+        return self._index.items
+
+
+class _IndexedSingleSelectBase(_IndexedSelectBase, _PnSingleSelectBase):
+    """
+    SingleSelectBase with all value and label lookups going through
+    the OptionIndex.
+    """
+
+    __abstract = True
+
+    def _process_param_change(self, msg):
+        msg = super(_PnSingleSelectBase, self)._process_param_change(msg)
+        index = self._index
+        labels, values = index.labels, index.values
+        unique = index.unique and self._allows_values
+        if 'value' in msg:
+            position = index.index(msg['value'])
+            if position is not None:
+                msg['value'] = (index.unicode_values if unique else labels)[position]
+            elif values:
+                self.value = self.param['value'].default if self._allows_none else values[0]
+                if not self._allows_none:
+                    del msg['value']
+            else:
+                self.value = self.param['value'].default
+                if self._allows_none:
+                    msg['value'] = self.value
+
+        option_prop = self._property_mapping.get('options', 'options')
+        is_list = isinstance(self.param['value'], param.List)
+        if option_prop in msg and not is_list:
+            msg[option_prop] = self._render_options(index)
+            if not values:
+                self.value = self.param['value'].default
+            elif self.value not in index:
+                self.value = self.param['value'].default if self._allows_none else values[0]
+        return msg
+
+    def _render_options(self, index: OptionIndex) -> list[Any]:
+        if not isinstance(self.options, dict):
+            return index.unicode_values
+        elif index.unique and self._allows_values:
+            return [(value, label) for label, value in zip(index.labels, index.unicode_values, strict=True)]
+        return index.labels
+
+    def _process_property_change(self, msg):
+        msg = super(_PnSingleSelectBase, self)._process_property_change(msg)
+        index = self._index
+        if 'value' in msg and index.values:
+            if msg['value'] == '':
+                msg['value'] = index.values[0]
+            else:
+                position = index.unicode_index(msg['value'])
+                if position is None:
+                    position = index.label_index(msg['value'])
+                if position is None:
+                    raise ValueError(f"{msg['value']} not in list")
+                msg['value'] = index.items[index.labels[position]]
+        msg.pop('options', None)
+        return msg
+
+
+class _IndexedMultiSelectBase(_IndexedSelectBase, _PnMultiSelectBase):
+    """
+    _MultiSelectBase with all value and label lookups going through
+    the OptionIndex.
+    """
+
+    __abstract = True
+
+    def _process_param_change(self, msg):
+        msg = super(_PnSingleSelectBase, self)._process_param_change(msg)
+        index = self._index
+        if 'value' in msg:
+            positions = (index.index(v) for v in msg['value'])
+            msg['value'] = [index.labels[i] for i in positions if i is not None]
+        if 'options' in msg:
+            msg['options'] = self._render_options(index)
+            if any(v not in index for v in self.value):
+                self.value = [v for v in self.value if v in index]
+        return msg
+
+    def _render_options(self, index: OptionIndex) -> list[Any]:
+        return index.labels
+
+    def _process_property_change(self, msg):
+        msg = super(_PnSingleSelectBase, self)._process_property_change(msg)
+        if 'value' in msg:
+            items = self._index.items
+            msg['value'] = [items[v] for v in msg['value'] if v in items]
+        msg.pop('options', None)
+        return msg
 
 
-class MaterialSingleSelectBase(MaterialWidget, _PnSingleSelectBase):
+class MaterialSingleSelectBase(MaterialWidget, _IndexedSingleSelectBase):
     value = param.Parameter(default=None, allow_None=True)
 
     __abstract = True
 
 
-class MaterialMultiSelectBase(MaterialWidget, _PnMultiSelectBase):
+class MaterialMultiSelectBase(MaterialWidget, _IndexedMultiSelectBase):
     value = param.List(default=None, allow_None=True)
 
     __abstract = True
 
 
-class AutocompleteInput(MaterialSingleSelectBase):
+class _HookTransform(ESMTransform):
+    """
+    Base class for transforms which only add hooks to the module of a
+    component, the component itself is not wrapped.
+    """
+
+    @classmethod
+    def apply(cls, component: type[ReactComponent], esm: str, input_component: str) -> tuple[str, str]:
+        return cls._transform.format(esm=esm), input_component
+
+
+class PatchedOptionsTransform(_HookTransform):
+    """
+    PatchedOptionsTransform provides the usePatchedOptions hook, which
+    splices the changes sent by the options operations of
+    _PatchableOptions into the rendered options.
+    """
+
+    _transform = """\
+{esm}
+
+// Splices the changes sent by the options operations on the server
+// into the options, without syncing the full list back.
+function usePatchedOptions(model) {{
+  const [options, setOptions] = model.useState("options")
+
+  React.useEffect(() => {{
+    const onMsg = (msg) => {{
+      if (msg.type !== "options") {{
+        return
+      }}
+      const current = model.data.options
+      const patched = current.slice(0, msg.index).concat(msg.options, current.slice(msg.index + msg.remove))
+      model.data.setv({{options: patched}}, {{silent: true}})
+      setOptions(patched)
+    }}
+    model.on("msg:custom", onMsg)
+    return () => model.off("msg:custom", onMsg)
+  }}, [])
+
+  return options
+}}
+"""
+
+
+
+class VirtualMenuTransform(_HookTransform):
+    """
+    VirtualMenuTransform provides the useVirtualMenu hook, which renders
+    the options of a menu as MenuItems, optionally windowed so only the
+    rows in view are mounted.
+    """
+
+    _transform = """\
+import VirtualMenuItem from "@mui/material/MenuItem"
+
+{esm}
+
+// Windowed menus only mount the rows in view plus VIRTUAL_MENU_OVERSCAN
+// rows on either side.
+const VIRTUAL_MENU_OVERSCAN = 5
+const NO_DISABLED_OPTIONS = new Set()
+
+function useVirtualMenu({{options, selected, enabled, itemHeight, visibleItems, menuProps = {{}}, disabled = NO_DISABLED_OPTIONS}}) {{
+  const [offset, setOffset] = React.useState(0)
+  const paperRef = React.useRef(null)
+  const pendingFocus = React.useRef(null)
+
+  React.useEffect(() => {{
+    // Focus a row once the window containing it has been rendered
+    if (pendingFocus.current === null || !paperRef.current) {{
+      return
+    }}
+    const item = paperRef.current.querySelector(`[data-index="${{pendingFocus.current}}"]`)
+    if (item) {{
+      item.focus()
+      pendingFocus.current = null
+    }}
+  }})
+
+  if (!enabled) {{
+    return {{
+      items: options.map((option, index) => (
+        <VirtualMenuItem key={{index}} value={{option}} disabled={{disabled.has(option)}}>
+          {{option}}
+        </VirtualMenuItem>
+      )),
+      menuProps,
+      onOpen: () => {{}},
+    }}
+  }}
+
+  const count = options.length
+
+  const windowOffset = (index) => Math.max(0, (index - Math.floor(visibleItems / 2)) * itemHeight)
+
+  const enabledIndex = (index, step) => {{
+    for (let i = index; i >= 0 && i < count; i += step) {{
+      if (!disabled.has(options[i])) {{
+        return i
+      }}
+    }}
+    return null
+  }}
+
+  const focusIndex = (index) => {{
+    if (index === null) {{
+      return
+    }}
+    const paper = paperRef.current
+    pendingFocus.current = index
+    paper.scrollTop = windowOffset(index)
+    setOffset(paper.scrollTop)
+  }}
+
+  const onKeyDown = (event) => {{
+    // MenuList can only navigate between mounted rows, jumps across
+    // the whole list have to scroll the target row into the window.
+    const current = Number(event.target.dataset?.index ?? 0)
+    switch (event.key) {{
+      case "Home":
+        focusIndex(enabledIndex(0, 1))
+        break
+      case "End":
+        focusIndex(enabledIndex(count - 1, -1))
+        break
+      case "PageDown":
+        event.preventDefault()
+        focusIndex(enabledIndex(Math.min(current + visibleItems, count - 1), 1) ??
+                   enabledIndex(Math.min(current + visibleItems, count - 1), -1))
+        break
+      case "PageUp":
+        event.preventDefault()
+        focusIndex(enabledIndex(Math.max(current - visibleItems, 0), -1) ??
+                   enabledIndex(Math.max(current - visibleItems, 0), 1))
+        break
+    }}
+  }}
+
+  const start = Math.max(0, Math.floor(offset / itemHeight) - VIRTUAL_MENU_OVERSCAN)
+  const end = Math.min(count, Math.ceil(offset / itemHeight) + visibleItems + VIRTUAL_MENU_OVERSCAN)
+  const items = options.slice(start, end).map((option, i) => (
+    <VirtualMenuItem
+      key={{start + i}}
+      value={{option}}
+      data-index={{start + i}}
+      disabled={{disabled.has(option)}}
+      sx={{{{height: itemHeight, minHeight: itemHeight}}}}
+    >
+      {{option}}
+    </VirtualMenuItem>
+  ))
+  // Spacers have no value, so Select leaves them alone and MenuList
+  // skips them during keyboard navigation.
+  items.unshift(<li key="before" aria-hidden style={{{{height: start * itemHeight}}}} />)
+  items.push(<li key="after" aria-hidden style={{{{height: (count - end) * itemHeight}}}} />)
+
+  return {{
+    items,
+    menuProps: {{
+      ...menuProps,
+      PaperProps: {{
+        ...menuProps.PaperProps,
+        onKeyDown,
+        onScroll: (event) => setOffset(event.currentTarget.scrollTop),
+        style: {{maxHeight: itemHeight * visibleItems + 16, ...menuProps.PaperProps?.style}},
+      }},
+      TransitionProps: {{
+        onEntering: (node) => {{
+          paperRef.current = node
+          node.scrollTop = offset
+        }},
+      }},
+    }},
+    // The menu is mounted on open and scrolled to the offset on entering
+    onOpen: () => setOffset(windowOffset(Math.max(0, options.indexOf(selected)))),
+  }}
+}}
+"""
+
+
+class _PatchableOptions:
+    """
+    List operations on the ``options`` which only send the change to
+    the browser, where it is spliced into the rendered options, instead
+    of the full list.
+    """
+
+    _esm_transforms = [PatchedOptionsTransform, ThemedTransform]
+
+    @property
+    def _options_rendered(self) -> bool:
+        return True
+
+    def append_option(self, option: Any) -> None:
+        """
+        Appends an option to the ``options``.
+        """
+        self._patch_options(len(self.options), 0, [option])
+
+    def extend_options(self, options: Iterable[Any]) -> None:
+        """
+        Appends multiple options to the ``options``.
+        """
+        self._patch_options(len(self.options), 0, list(options))
+
+    def insert_option(self, index: int, option: Any) -> None:
+        """
+        Inserts an option before the given position, like `list.insert`.
+        """
+        index = slice(index, None).indices(len(self.options))[0]
+        self._patch_options(index, 0, [option])
+
+    def remove_option(self, option: Any) -> None:
+        """
+        Removes the first option equal to the given option.
+        """
+        index = self._index.index(option)
+        if index is None:
+            raise ValueError(f'{option!r} is not one of the options of {type(self).__name__}.')
+        self._patch_options(index, 1, [])
+
+    def _patch_options(self, index: int, remove: int, options: list[Any]) -> None:
+        if not isinstance(self.options, list):
+            raise TypeError(
+                f'Only list options of {type(self).__name__} can be patched, '
+                'assign a new dictionary of options instead.'
+            )
+        if self._options_rendered:
+            entries = self._render_options(OptionIndex(options, self._option_labels(options)))
+            # Rendered models may share their list of options, so each
+            # distinct list is spliced once.
+            rendered = {id(model.data.options): model.data.options for model, _ in self._models.values()}
+            for opts in rendered.values():
+                opts[index:index+remove] = entries
+            self._send_msg({'type': 'options', 'index': index, 'remove': remove, 'options': entries})
+        with param.discard_events(self):
+            self.options = self.options[:index] + options + self.options[index+remove:]
+        # Watchers run as for any other change of the options, the
+        # rendered options already match so they are not sent again.
+        self.param.trigger('options')
+
+
+class AutocompleteInput(_PatchableOptions, MaterialSingleSelectBase):
     """
     The `AutocompleteInput` widget allows searching and selecting a single value
     from a list of `options`.
@@ -48,6 +446,24 @@ class AutocompleteInput(MaterialSingleSelectBase):
     case_sensitive = param.Boolean(default=True, doc="""
         Enable or disable case sensitivity.""")
 
+    completer = param.Callable(default=None, allow_refs=False, doc="""
+        Optional sync or async callable which is given the entered text
+        and returns the completions in ``search_mode='server'``, e.g. to
+        look them up in a database instead of the ``options``. Lookups
+        superseded by a newer query are cancelled, so slow lookups
+        should be async.""")
+
+    completions = param.List(default=[], readonly=True, doc="""
+        The options matching the entered text when ``search_mode`` is
+        ``'server'``.""")
+
+    completions_query = param.String(default=None, allow_None=True, readonly=True, doc="""
+        The entered text the current ``completions`` were looked up for.""")
+
+    debounce = param.Integer(default=150, bounds=(0, None), doc="""
+        Time in milliseconds to wait for further key presses before
+        looking up completions in ``search_mode='server'``.""")
+
     min_characters = param.Integer(default=2, doc="""
         The number of characters a user must type before
         completions are presented.""")
@@ -58,10 +474,26 @@ class AutocompleteInput(MaterialSingleSelectBase):
         Placeholder for empty input field.""",
     )
 
+    query_id = param.String(default=None, allow_None=True, readonly=True, doc="""
+        Id of the query the current ``completions`` answer. Each view in
+        the browser tags its queries with ids of its own and only
+        displays completions answering its latest query.""")
+
     restrict = param.Boolean(default=True, doc="""
         Set to False in order to allow users to enter text that is not
         present in the list of completion strings.""")
 
+    search_mode = param.Selector(default='client', objects=['client', 'server'], doc="""
+        Whether the options are searched in the browser (``'client'``) or
+        on the server (``'server'``). In server mode the options are never
+        sent to the browser, instead the entered text is looked up in an
+        index of the options (or passed to the ``completer``) and only the
+        first ``search_option_limit`` matches are sent back. Use it for lists of options too large to
+        ship to the browser.""")
+
+    search_option_limit = param.Integer(default=20, bounds=(1, None), doc="""
+        Maximum number of matches returned by a server-side search.""")
+
     search_strategy = param.Selector(default='starts_with',
         objects=['starts_with', 'includes'], doc="""
         Define how to search the list of completion strings. The default option
@@ -85,6 +517,105 @@ class AutocompleteInput(MaterialSingleSelectBase):
 
     _rename = {"name": "name"}
 
+    # Parameters which change the completions returned for a query
+    _search_params = ('options', 'case_sensitive', 'completer', 'search_option_limit', 'search_strategy')
+
+    def __init__(self, **params):
+        super().__init__(**params)
+        self._latest_query: str | None = None
+        self._search_index = None
+        self._search_task = None
+        self._internal_callbacks.extend([
+            self.param.watch(
+                self._update_completions,
+                ['options', 'case_sensitive', 'completer', 'min_characters', 'search_mode',
+                 'search_option_limit', 'search_strategy', 'value_input']
+            ),
+            self.param.watch(self._update_search_mode, 'search_mode'),
+        ])
+        self._update_completions()
+
+    @property
+    def _options_rendered(self) -> bool:
+        return self.search_mode == 'client'
+
+    def _update_search_mode(self, event):
+        # Options are only sent to the browser in client mode
+        self.param.trigger('options')
+
+    def _update_completions(self, *events):
+        if any(event.name in ('options', 'case_sensitive') for event in events):
+            self._search_index = None
+        if self.search_mode == 'server' and any(event.name in self._search_params for event in events):
+            # Completions cached by the browser are no longer valid
+            self._send_msg({'type': 'invalidate'})
+        if [event.name for event in events] == ['value_input'] and (
+            'value_input' in self._in_process__events.get(state.curdoc, {})
+        ):
+            # The browser sends its queries tagged with an id, see _handle_msg
+            return
+        self._search(self.value_input)
+
+    def _handle_msg(self, msg: Any) -> None:
+        if msg.get('type') == 'search':
+            self._latest_query = msg['id']
+            self._search(msg['query'], debounce=True)
+
+    def _search(self, query: str | None, debounce: bool = False) -> None:
+        """
+        Looks up the completions for the query, cancelling any lookup
+        still in flight. On a running event loop queries from the
+        browser are debounced and completers are called in a task, all
+        other lookups are answered immediately.
+        """
+        if self._search_task is not None:
+            self._search_task.cancel()
+            self._search_task = None
+        query_id = self._latest_query
+        if self.search_mode != 'server' or query is None or len(query) < self.min_characters:
+            self._set_completions([], query_id, query)
+            return
+        delay = self.debounce / 1000 if debounce else 0
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        if loop is not None and (delay or self.completer is not None):
+            self._search_task = loop.create_task(self._search_async(query, query_id, delay))
+            return
+        completions = self._lookup(query)
+        if inspect.isawaitable(completions):
+            completions = asyncio.run(completions)
+        self._set_completions(completions, query_id, query)
+
+    async def _search_async(self, query: str, query_id: str | None, delay: float) -> None:
+        try:
+            if delay:
+                await asyncio.sleep(delay)
+            completions = self._lookup(query)
+            if inspect.isawaitable(completions):
+                completions = await completions
+        except Exception as e:
+            state._handle_exception(e)
+        else:
+            # A completer swallowing the cancellation must not win
+            if self._search_task is asyncio.current_task():
+                self._search_task = None
+                self._set_completions(completions, query_id, query)
+
+    def _lookup(self, query: str):
+        if self.completer is not None:
+            return self.completer(query)
+        if self._search_index is None:
+            self._search_index = SearchIndex(self.labels, case_sensitive=self.case_sensitive)
+        return self._search_index.search(query, self.search_strategy, self.search_option_limit)
+
+    def _set_completions(self, completions, query_id: str | None, query: str | None) -> None:
+        completions = list(completions)[:self.search_option_limit]
+        if (completions, query_id, query) != (self.completions, self.query_id, self.completions_query):
+            with edit_readonly(self):
+                self.param.update(completions=completions, completions_query=query, query_id=query_id)
+
     def _process_property_change(self, msg):
         if 'value' in msg and msg['value'] is None:
             return msg
@@ -96,12 +627,21 @@ class AutocompleteInput(MaterialSingleSelectBase):
         return super()._process_property_change(msg)
 
     def _process_param_change(self, msg):
-        if 'value' in msg and not self.restrict and not isIn(msg['value'], self.values):
+        if 'completer' in msg:
+            # The browser only needs to know whether results may be
+            # refined locally, which is not true for custom completers
+            msg = dict(msg, completer=msg['completer'] is not None)
+        value = msg.get('value')
+        # An empty value is reset to itself by the base class, which
+        # would otherwise retrigger this method indefinitely.
+        if 'value' in msg and (value is None or not (self.restrict or value in self._index)):
             with param.parameterized.discard_events(self):
                 props = super()._process_param_change(msg)
                 self.value = props['value'] = msg['value']
         else:
             props = super()._process_param_change(msg)
+        if 'options' in props and self.search_mode == 'server':
+            props['options'] = []
         return props
 
     @param.depends('value', watch=True, on_init=True)
@@ -110,7 +650,7 @@ class AutocompleteInput(MaterialSingleSelectBase):
             self.value_input = self.value
 
 
-class Select(MaterialSingleSelectBase):
+class Select(_PatchableOptions, MaterialSingleSelectBase):
     """
     The `Select` widget allows selecting a value from a list.
 
@@ -133,13 +673,25 @@ class Select(MaterialSingleSelectBase):
 
     variant = param.Selector(objects=["filled", "outlined", "standard"], default="outlined")
 
+    virtualize = param.Boolean(default=False, doc="""
+        Whether to only render the options currently scrolled into view
+        when the menu is open, which keeps opening the menu fast for
+        very long lists of ``options``.""")
+
     _esm_base = "Select.jsx"
 
+    _esm_transforms = [PatchedOptionsTransform, VirtualMenuTransform, ThemedTransform]
+
     _rename = {"name": "name"}
 
+    _disabled_index: OptionIndex | None = None
+
     def __init__(self, **params):
         super().__init__(**params)
         self._internal_callbacks.extend([
+            self.param._watch(
+                self._reset_disabled_index, 'disabled_options', precedence=-1
+            ),
             self.param.watch(
                 self._validate_disabled_options,
                 ['options', 'disabled_options', 'value']
@@ -147,6 +699,15 @@ class Select(MaterialSingleSelectBase):
         ])
         self._validate_disabled_options()
 
+    def _reset_disabled_index(self, *events):
+        self._disabled_index = None
+
+    @property
+    def _disabled(self) -> OptionIndex:
+        if self._disabled_index is None:
+            self._disabled_index = OptionIndex(self.disabled_options)
+        return self._disabled_index
+
     def _validate_disabled_options(self, *events):
         if self.disabled_options and self.disabled_options == self.values:
             raise ValueError(
@@ -156,24 +717,25 @@ class Select(MaterialSingleSelectBase):
         not_in_opts = [
             dopts
             for dopts in self.disabled_options
-            if dopts not in (self.values or [])
+            if dopts not in self._index
         ]
         if not_in_opts:
             raise ValueError(
                 f'Cannot disable non existing options of {type(self).__name__}: {not_in_opts}'
             )
+        disabled = self.value in self._disabled
         if len(events) == 1:
-            if events[0].name == 'value' and self.value in self.disabled_options:
+            if events[0].name == 'value' and disabled:
                 raise ValueError(
                     f'Cannot set the value of {type(self).__name__} to '
                     f'{self.value!r} as it is a disabled option.'
                 )
-            elif events[0].name == 'disabled_options' and self.value in self.disabled_options:
+            elif events[0].name == 'disabled_options' and disabled:
                 raise ValueError(
                     f'Cannot set disabled_options of {type(self).__name__} to a list that '
                     f'includes the current value {self.value!r}.'
                 )
-        if self.value in self.disabled_options:
+        if disabled:
             raise ValueError(
                 f'Cannot initialize {type(self).__name__} with value {self.value!r} '
                 'as it is one of the disabled options.'
@@ -328,7 +890,7 @@ class CheckButtonGroup(ButtonGroup, MaterialMultiSelectBase):
     _constants = {"exclusive": False}
 
 
-class MultiChoice(MaterialMultiSelectBase):
+class MultiChoice(_PatchableOptions, MaterialMultiSelectBase):
     """
     The `MultiChoice` widget allows selecting multiple values from a list of
     `options`.
@@ -375,6 +937,13 @@ class MultiChoice(MaterialMultiSelectBase):
 
     value = param.List(default=[])
 
+    virtualize = param.Boolean(default=False, doc="""
+        Whether to only render the options currently scrolled into view
+        when the menu is open, which keeps opening the menu fast for
+        very long lists of ``options``.""")
+
     _rename = {"name": None}
 
     _esm_base = "MultiChoice.jsx"
+
+    _esm_transforms = [PatchedOptionsTransform, VirtualMenuTransform, ThemedTransform]
@@ -0,0 +1,153 @@
+"""
+Server-side benchmarks of constructing, rendering and updating components.
+
+Run them with:
+
+    pytest tests/benchmarks --perf --benchmark-autosave
+
+and compare against a previous run with --benchmark-compare. The
+number of instances can be overridden with the comma separated
+PANEL_MATERIAL_UI_BENCH_INSTANCES (construction) and
+PANEL_MATERIAL_UI_BENCH_MODELS (rendering and updates) environment
+variables.
+"""
+import os
+
+import param
+import pytest
+
+pytest.importorskip('pytest_benchmark')
+
+from bokeh.document import Document
+from panel.io.compile import find_components
+from panel.layout import Column
+
+from panel_material_ui.theme import DocumentTheme
+from panel_material_ui.widgets import Button
+
+pytestmark = pytest.mark.perf
+
+
+def _sizes(var, default):
+    return [int(n) for n in os.environ.get(var, default).split(',')]
+
+
+INSTANCES = _sizes('PANEL_MATERIAL_UI_BENCH_INSTANCES', '1000,10000')
+
+# Rendering a model is roughly 20x as expensive as constructing a component
+MODELS = _sizes('PANEL_MATERIAL_UI_BENCH_MODELS', '100,1000')
+
+# Arguments required to construct a renderable instance
+KWARGS = {
+    'CheckBoxGroup': {'value': []},
+    'CheckButtonGroup': {'value': []},
+}
+
+# Parameters changed by the bulk update, covering widget state,
+# layout, styling and the theme overrides of a component
+UPDATES = {
+    'disabled': (param.Boolean, lambda i: bool(i % 2)),
+    'label': (param.String, lambda i: f'Label {i}'),
+    'width': (param.Integer, lambda i: 300 + i % 2),
+    'css_classes': (param.List, lambda i: [f'class-{i % 2}']),
+    'dark_theme': (param.Boolean, lambda i: bool(i % 2)),
+    'theme_config': (param.Dict, lambda i: {'palette': {'primary': {'main': ('#1976d2', '#9c27b0')[i % 2]}}}),
+}
+
+UNRENDERABLE = {
+    'DatetimeRangePicker': 'DatetimeRangePicker does not implement _deserialize_value',
+}
+
+
+def components():
+    return sorted(
+        (
+            c for c in find_components('panel_material_ui.bundle')
+            if c.__module__.split('.')[1] in ('layout', 'pane', 'widgets')
+        ),
+        key=lambda c: c.__name__
+    )
+
+
+def renderable_components():
+    return [
+        pytest.param(c, marks=pytest.mark.xfail(reason=UNRENDERABLE[c.__name__]))
+        if c.__name__ in UNRENDERABLE else c
+        for c in components()
+    ]
+
+
+def build(component, n):
+    kwargs = KWARGS.get(component.__name__, {})
+    return [component(**kwargs) for _ in range(n)]
+
+
+def render(objects):
+    doc = Document()
+    root = Column(*objects).get_root(doc)
+    doc.add_root(root)
+    return doc
+
+
+def render_json(objects):
+    doc = render(objects)
+    doc.to_json()
+    return doc
+
+
+def rounds(n):
+    # Repeat small benchmarks, but cap the total runtime
+    return min(10, max(1, 10_000 // n))
+
+
+@pytest.mark.parametrize('n', INSTANCES)
+@pytest.mark.parametrize('component', components(), ids=lambda c: c.__name__)
+def test_construct(benchmark, component, n):
+    benchmark.group = f'construct-{n}'
+    objects = benchmark.pedantic(build, args=(component, n), rounds=rounds(n), iterations=1)
+    assert len(objects) == n
+
+
+@pytest.mark.parametrize('n', MODELS)
+@pytest.mark.parametrize('component', renderable_components(), ids=lambda c: c.__name__)
+def test_render(benchmark, component, n):
+    benchmark.group = f'render-{n}'
+
+    def setup():
+        return (build(component, n),), {}
+
+    doc = benchmark.pedantic(render_json, setup=setup, rounds=rounds(n), iterations=1)
+    assert doc.roots
+
+
+@pytest.mark.parametrize('n', MODELS)
+@pytest.mark.parametrize('component', renderable_components(), ids=lambda c: c.__name__)
+def test_bulk_update(benchmark, component, n):
+    benchmark.group = f'update-{n}'
+    objects = build(component, n)
+    render(objects)
+    params = {
+        p: value for p, (ptype, value) in UPDATES.items()
+        if p in component.param and isinstance(component.param[p], ptype)
+    }
+    count = iter(range(1, 1_000_000))
+
+    def update():
+        i = next(count)
+        for obj in objects:
+            obj.param.update({p: value(i) for p, value in params.items()})
+
+    benchmark.pedantic(update, rounds=rounds(n), iterations=1)
+
+
+@pytest.mark.parametrize('n', MODELS)
+def test_theme_update(benchmark, n):
+    benchmark.group = f'theme-{n}'
+    objects = build(Button, n)
+    doc = render(objects)
+    theme = DocumentTheme.for_document(doc)
+
+    def update():
+        theme.dark_theme = not theme.dark_theme
+
+    benchmark.pedantic(update, rounds=rounds(n), iterations=1)
@@ -28,8 +28,17 @@ if os.name != 'nt':
     resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
 
 
+# Options of the benchmark and bundle size suites
+TEST_ENV_VARS = (
+    "PANEL_LOG_LEVEL",
+    "PANEL_MATERIAL_UI_BENCH_INSTANCES",
+    "PANEL_MATERIAL_UI_BENCH_MODELS",
+    "PANEL_MATERIAL_UI_BUNDLE_BUDGET",
+    "PANEL_MATERIAL_UI_PERF_OUTPUT",
+)
+
 for e in os.environ:
-    if e.startswith(('BOKEH_', "PANEL_")) and e not in ("PANEL_LOG_LEVEL", ):
+    if e.startswith(('BOKEH_', "PANEL_")) and e not in TEST_ENV_VARS:
         os.environ.pop(e, None)
 
 try:
@@ -68,6 +77,11 @@ optional_markers = {
         "marker-descr": "UI test marker",
         "skip-reason": "Test only runs with the --ui option."
     },
+    "perf": {
+        "help": "Runs performance benchmarks",
+        "marker-descr": "Performance benchmark marker",
+        "skip-reason": "Test only runs with the --perf option."
+    },
 }
 
 
@@ -0,0 +1,395 @@
+import asyncio
+import importlib
+import os
+import pathlib
+import threading
+
+import pytest
+from panel.config import config
+from panel.layout import Column
+
+from panel_material_ui.base import MaterialComponent
+from panel_material_ui.widgets import Button, TextInput
+
+
+@pytest.fixture
+def esm_cache():
+    MaterialComponent._invalidate_esm_cache()
+    yield MaterialComponent._esm_cache
+    MaterialComponent._invalidate_esm_cache()
+
+
+@pytest.fixture
+def source_component(tmp_path):
+    esm_path = tmp_path / 'Custom.jsx'
+    esm_path.write_text('export function render({model}) { return <div/> }')
+
+    class Custom(MaterialComponent):
+        _esm_base = str(esm_path)
+
+    return Custom, esm_path
+
+
+def test_render_esm_cached(esm_cache, monkeypatch):
+    reads = []
+    read_text = pathlib.Path.read_text
+
+    def counting_read_text(self, *args, **kwargs):
+        reads.append(self)
+        return read_text(self, *args, **kwargs)
+
+    monkeypatch.setattr(pathlib.Path, 'read_text', counting_read_text)
+
+    esm = Button._render_esm(compiled='compiling')
+    assert Button._render_esm(compiled='compiling') == esm
+    assert reads == [Button._esm_path(compiled='compiling')]
+    assert Button in esm_cache
+
+
+def test_render_esm_cache_per_class(esm_cache):
+    button_esm = Button._render_esm(compiled='compiling')
+    text_esm = TextInput._render_esm(compiled='compiling')
+    assert button_esm != text_esm
+    assert set(esm_cache) == {Button, TextInput}
+
+
+def test_render_esm_cache_invalidated_on_source_change(esm_cache, source_component):
+    Custom, esm_path = source_component
+    assert '<div/>' in Custom._render_esm(compiled='compiling')
+
+    esm_path.write_text('export function render({model}) { return <span/> }')
+    stat = esm_path.stat()
+    os.utime(esm_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    # Production mode trusts the cache, autoreload checks the source
+    assert '<div/>' in Custom._render_esm(compiled='compiling')
+    config.autoreload = True
+    try:
+        assert '<span/>' in Custom._render_esm(compiled='compiling')
+    finally:
+        config.autoreload = False
+
+
+def test_render_esm_cache_invalidated_on_transform_change(esm_cache, source_component):
+    Custom, _ = source_component
+    assert 'ThemeProvider' in Custom._render_esm(compiled='compiling')
+
+    Custom._esm_transforms = []
+    assert 'ThemeProvider' not in Custom._render_esm(compiled='compiling')
+
+
+def test_invalidate_esm_cache_by_path(esm_cache, source_component):
+    Custom, esm_path = source_component
+    Custom._render_esm(compiled='compiling')
+    Button._render_esm(compiled='compiling')
+
+    MaterialComponent._invalidate_esm_cache({esm_path})
+
+    assert Custom not in esm_cache
+    assert Button in esm_cache
+
+
+def test_themed_transform_wraps_component(esm_cache):
+    esm = Button._render_esm(compiled='compiling')
+    assert 'function ThemedButton(props)' in esm
+    assert esm.rstrip().endswith('export default { render: ThemedButton }')
+
+
+@pytest.fixture
+def bundle_css(tmp_path, monkeypatch):
+    base = importlib.import_module('panel_material_ui.base')
+    dist = tmp_path / 'dist'
+    dist.mkdir()
+    (dist / 'bundle.js').write_text('')
+    (dist / 'bundle.css').write_text('')
+    (dist / 'material-icons-ABCD1234.woff2').write_bytes(b'')
+    monkeypatch.setattr(base, 'BASE_PATH', tmp_path)
+    monkeypatch.setattr(MaterialComponent, '_bundle_css_cache', {})
+
+    class Custom(MaterialComponent):
+        _bundle = dist / 'bundle.js'
+
+    return Custom, dist
+
+
+def test_bundle_css_cached(bundle_css, monkeypatch):
+    Custom, dist = bundle_css
+    expected = [str(dist / 'bundle.css'), str(dist / 'material-icons-ABCD1234.woff2')]
+    assert Custom._bundle_css == expected
+
+    globs = []
+    glob = pathlib.Path.glob
+    monkeypatch.setattr(pathlib.Path, 'glob', lambda self, pattern: globs.append(pattern) or glob(self, pattern))
+    (dist / 'bundle.css').unlink()
+
+    assert Custom._bundle_css == expected
+    assert not globs
+
+    # Cleared by the autoreload watcher when the dist directory changes
+    MaterialComponent._bundle_css_cache.clear()
+    assert Custom._bundle_css == []
+
+
+def test_bundle_css_cached_per_class(bundle_css):
+    Custom, dist = bundle_css
+    assert Custom._bundle_css != Button._bundle_css
+
+    assert set(MaterialComponent._bundle_css_cache) == {Custom, Button}
+    assert MaterialComponent._bundle_css_cache[Custom] != MaterialComponent._bundle_css_cache[Button]
+
+
+@pytest.fixture
+def release_chunks(tmp_path, monkeypatch):
+    base = importlib.import_module('panel_material_ui.base')
+    cdn_base = 'https://cdn.holoviz.org/panel-material-ui/v1.0.0/'
+    monkeypatch.setattr(base, '__version__', '1.0.0')
+    monkeypatch.setattr(base, 'CDN_BASE', cdn_base)
+    monkeypatch.setattr(base, 'CDN_DIST', f'{cdn_base}panel-material-ui.bundle.js')
+    monkeypatch.setattr(base, 'CHUNK_PATH', tmp_path)
+    return tmp_path, cdn_base
+
+
+def test_render_esm_uses_component_chunk(release_chunks):
+    chunk_dir, cdn_base = release_chunks
+    (chunk_dir / 'Button.js').write_text('')
+
+    assert Button._render_esm(compiled=True) == f'{cdn_base}chunks/Button.js'
+    assert TextInput._render_esm(compiled=True) == f'{cdn_base}panel-material-ui.bundle.js'
+
+
+def test_get_properties_component_chunk(release_chunks, document):
+    chunk_dir, cdn_base = release_chunks
+    (chunk_dir / 'Button.js').write_text('')
+    (chunk_dir / 'Button.css').write_text('')
+    (chunk_dir / 'TextInput.js').write_text('')
+
+    button_props = Button()._get_properties(document)
+    assert button_props['bundle'] == 'url'
+    assert button_props['esm'] == f'{cdn_base}chunks/Button.js'
+    assert button_props['css_bundle'] == f'{cdn_base}chunks/Button.css'
+
+    text_props = TextInput()._get_properties(document)
+    assert text_props['esm'] == f'{cdn_base}chunks/TextInput.js'
+    assert text_props['css_bundle'] is None
+
+
+def test_get_properties_bundle_importmap(release_chunks, document):
+    props = Button()._get_properties(document)
+    assert props['bundle'] == 'url'
+    assert list(props['importmap']['imports']) == ['@mui/material/']
+
+
+def test_serialized_data_omits_defaults(release_chunks, document):
+    root = Column(TextInput(), TextInput(label='Name')).get_root(document)
+    document.add_root(root)
+    serialized = document.to_json()
+
+    children = serialized['roots'][0]['attributes']['children']
+    default, custom = (child['attributes']['data']['attributes'] for child in children)
+    assert 'esm_constants' not in default
+    assert 'label' not in default
+    assert custom['label'] == 'Name'
+    definition = next(d for d in serialized['defs'] if d['name'] == TextInput._data_model.__name__)
+    constants = next(p for p in definition['properties'] if p['name'] == 'esm_constants')
+    assert dict(constants['default']['entries']) == {'multiline': False}
+
+
+@pytest.fixture
+def batched_button(release_chunks, document, monkeypatch):
+    monkeypatch.setattr(MaterialComponent, '_batch_updates', True)
+    button = Button()
+    model = button.get_root(document)
+    patches = []
+    update_model = Button._update_model
+
+    def recording_update_model(self, events, msg, *args):
+        patches.append(dict(msg))
+        update_model(self, events, msg, *args)
+
+    monkeypatch.setattr(Button, '_update_model', recording_update_model)
+    return button, model, patches
+
+
+def test_batched_param_changes_single_patch(batched_button):
+    button, model, patches = batched_button
+
+    async def update():
+        button.label = 'Foo'
+        button.disabled = True
+        button.button_type = 'success'
+        assert patches == []
+        await asyncio.sleep(0)
+
+    asyncio.run(update())
+    assert len(patches) == 1
+    assert model.data.label == 'Foo'
+    assert model.data.disabled
+    assert model.data.button_type == 'success'
+
+
+def test_batched_param_changes_merge_events(batched_button):
+    button, model, patches = batched_button
+
+    async def update():
+        button.label = 'Foo'
+        button.label = 'Bar'
+        await asyncio.sleep(0)
+
+    asyncio.run(update())
+    assert len(patches) == 1
+    assert patches[0]['label'] == 'Bar'
+    assert model.data.label == 'Bar'
+
+
+def test_batched_param_changes_without_event_loop(batched_button):
+    button, model, patches = batched_button
+    button.label = 'Foo'
+    button.disabled = True
+    assert len(patches) == 2
+    assert model.data.label == 'Foo'
+
+
+@pytest.fixture
+def hot_component(tmp_path, monkeypatch, source_component):
+    Custom, esm_path = source_component
+    bundle = tmp_path / 'bundle.js'
+    bundle.write_text('')
+    stat = bundle.stat()
+    os.utime(esm_path, ns=(stat.st_atime_ns, stat.st_mtime_ns - 10**9))
+    compiled = []
+
+    def compile_hot_esm(cls):
+        compiled.append(cls)
+        return f'// {len(compiled)}'
+
+    monkeypatch.setattr(MaterialComponent, '_bundle', bundle)
+    monkeypatch.setattr(MaterialComponent, '_hot_build_dir', str(tmp_path))
+    monkeypatch.setattr(MaterialComponent, '_hot_cache', {})
+    monkeypatch.setattr(MaterialComponent, '_compile_hot_esm', classmethod(compile_hot_esm))
+    monkeypatch.setattr(config, 'autoreload', True)
+    return Custom, esm_path, compiled
+
+
+def edit(path):
+    stat = path.stat()
+    path.write_text(path.read_text() + '\n')
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2 * 10**9))
+
+
+def test_hot_esm_unused_while_bundle_up_to_date(hot_component):
+    Custom, _, compiled = hot_component
+    assert Custom._hot_esm() is None
+    assert not compiled
+
+
+def test_hot_esm_compiled_once_per_edit(hot_component):
+    Custom, esm_path, compiled = hot_component
+    edit(esm_path)
+
+    esm, digest = Custom._hot_esm()
+    assert esm == '// 1'
+    assert Custom._hot_esm() == (esm, digest)
+    assert compiled == [Custom]
+
+    edit(esm_path)
+    assert Custom._hot_esm()[0] == '// 2'
+
+
+def test_hot_esm_requires_autoreload(hot_component):
+    Custom, esm_path, compiled = hot_component
+    edit(esm_path)
+    config.autoreload = False
+    assert Custom._hot_esm() is None
+
+
+def test_hot_esm_only_affects_edited_class(hot_component):
+    Custom, esm_path, compiled = hot_component
+    edit(esm_path)
+    Custom._hot_esm()
+    assert Button._hot_esm() is None
+    assert compiled == [Custom]
+
+
+def test_hot_esm_keeps_previous_module_on_error(hot_component, monkeypatch):
+    Custom, esm_path, compiled = hot_component
+    edit(esm_path)
+    hot = Custom._hot_esm()
+
+    def fail(cls):
+        raise RuntimeError('Syntax error')
+
+    monkeypatch.setattr(MaterialComponent, '_compile_hot_esm', classmethod(fail))
+    edit(esm_path)
+    assert Custom._hot_esm() == hot
+
+
+def test_get_properties_hot_esm(hot_component, document):
+    Custom, esm_path, _ = hot_component
+    edit(esm_path)
+    props = Custom()._get_properties(document)
+    esm, digest = Custom._hot_esm()
+    assert props['esm'] == esm
+    assert props['bundle'] == digest
+
+
+def test_update_esm_restores_bundle(hot_component, document, monkeypatch):
+    Custom, esm_path, _ = hot_component
+    monkeypatch.setattr(Custom, '_setup_autoreload', lambda self: None)
+    component = Custom()
+    model = component.get_root(document)
+    edit(esm_path)
+    component._update_esm()
+    assert model.bundle == Custom._hot_esm()[1]
+
+    # Recompiling the bundle supersedes the hot module
+    stat = esm_path.stat()
+    os.utime(MaterialComponent._bundle, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    component._update_esm()
+
+    props = component._get_properties(document)
+    assert {prop: getattr(model, prop) for prop in ('bundle', 'css_bundle', 'esm', 'importmap')} == {
+        prop: props[prop] for prop in ('bundle', 'css_bundle', 'esm', 'importmap')
+    }
+    component._cleanup(model)
+
+
+def test_compile_hot_esm_async_off_event_loop(hot_component, monkeypatch):
+    Custom, esm_path, compiled = hot_component
+    threads = []
+
+    def compile_hot_esm(cls):
+        threads.append(threading.get_ident())
+        compiled.append(cls)
+        return f'// {len(compiled)}'
+
+    monkeypatch.setattr(MaterialComponent, '_compile_hot_esm', classmethod(compile_hot_esm))
+    edit(esm_path)
+
+    async def compile_twice():
+        await asyncio.gather(Custom._compile_hot_esm_async(), Custom._compile_hot_esm_async())
+
+    asyncio.run(compile_twice())
+
+    assert len(threads) == 1 and threads[0] != threading.get_ident()
+    assert Custom._hot_esm()[0] == '// 1'
+    assert compiled == [Custom]
+
+
+def test_update_esm_hot_swap(hot_component, document, monkeypatch):
+    Custom, esm_path, _ = hot_component
+    monkeypatch.setattr(Custom, '_setup_autoreload', lambda self: None)
+    component = Custom()
+    model = component.get_root(document)
+    processed = []
+
+    def process_param_change(self, msg):
+        processed.append(msg)
+        return msg
+
+    monkeypatch.setattr(Custom, '_process_param_change', process_param_change)
+    edit(esm_path)
+    component._update_esm()
+
+    assert (model.esm, model.bundle) == Custom._hot_esm()
+    assert not processed
+    component._cleanup(model)
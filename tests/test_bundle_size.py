@@ -0,0 +1,185 @@
+"""
+Bundle size budgets.
+
+Reports the gzipped size of the compiled bundles and of the code
+attributed to each component and each ESM transform, and fails if any
+of them exceeds the budgets defined in bundle_budget.json (or in the
+file pointed to by the PANEL_MATERIAL_UI_BUNDLE_BUDGET environment
+variable). All sizes are in bytes after gzip compression.
+
+Checks on compiled artifacts are skipped if the bundle has not been
+built. To print the full report run:
+
+    python tests/test_bundle_size.py [--json report.json]
+"""
+from __future__ import annotations
+
+import gzip
+import json
+import os
+import pathlib
+import re
+import sys
+
+import pytest
+from panel.io.compile import find_components
+
+from panel_material_ui.base import BASE_PATH
+
+DIST_PATH = BASE_PATH / 'dist'
+CHUNK_PATH = DIST_PATH / 'chunks'
+BUDGET_PATH = pathlib.Path(
+    os.environ.get('PANEL_MATERIAL_UI_BUNDLE_BUDGET', pathlib.Path(__file__).parent / 'bundle_budget.json')
+)
+
+# Barrel imports pull whole packages into the bundle (or at least into
+# the build), components must import individual modules instead
+BARREL_RE = re.compile(r'''from\s+["'](@mui/icons-material|@mui/material|@mui/x-date-pickers)["']''')
+
+# Imports of shared chunks in the minified per-component entry modules
+CHUNK_IMPORT_RE = re.compile(r'''(?:from|import)\s*["']\./(shared-[\w-]+\.js)["']''')
+
+
+def gzip_size(data: str | bytes) -> int:
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    return len(gzip.compress(data, compresslevel=9, mtime=0))
+
+
+def load_budget() -> dict:
+    return json.loads(BUDGET_PATH.read_text())
+
+
+def esm_components():
+    components = find_components('panel_material_ui.bundle')
+    return sorted((c for c in components if c._esm_base), key=lambda c: c.__name__)
+
+
+def render_esm(component, transforms) -> str:
+    original = component._esm_transforms
+    component._esm_transforms = transforms
+    try:
+        return component._transform_esm(component._esm_path(compiled='compiling').read_text())
+    finally:
+        component._esm_transforms = original
+
+
+def transform_sizes(component) -> dict[str, int]:
+    """
+    Returns the gzipped size each transform adds to the rendered ESM
+    of the component.
+    """
+    transforms = list(component._esm_transforms or [])
+    full = gzip_size(render_esm(component, transforms))
+    return {
+        transform.__name__: full - gzip_size(render_esm(component, [t for t in transforms if t is not transform]))
+        for transform in transforms
+    }
+
+
+def chunk_sizes(name: str) -> tuple[int, int] | None:
+    """
+    Returns the gzipped size of the entry module of a component and of
+    the entry module including all the shared chunks it (transitively)
+    imports, or None if the chunks have not been built.
+    """
+    entry = CHUNK_PATH / f'{name}.js'
+    if not entry.is_file():
+        return None
+    seen, queue = set(), [entry.name]
+    total = 0
+    while queue:
+        chunk = queue.pop()
+        if chunk in seen:
+            continue
+        seen.add(chunk)
+        code = (CHUNK_PATH / chunk).read_text()
+        total += gzip_size(code)
+        queue.extend(CHUNK_IMPORT_RE.findall(code))
+    return gzip_size(entry.read_text()), total
+
+
+def bundle_report() -> dict:
+    bundles = {}
+    for path in sorted(DIST_PATH.glob('*.bundle.js')):
+        data = path.read_bytes()
+        bundles[path.name] = {'size': len(data), 'gzip': gzip_size(data)}
+    components, transforms = {}, {}
+    for component in esm_components():
+        name = component.__name__
+        report = {'source_gzip': gzip_size(render_esm(component, component._esm_transforms))}
+        sizes = chunk_sizes(name)
+        if sizes is not None:
+            report['entry_gzip'], report['loaded_gzip'] = sizes
+        for transform, size in transform_sizes(component).items():
+            transforms[transform] = max(transforms.get(transform, 0), size)
+        components[name] = report
+    return {'bundles': bundles, 'components': components, 'transforms': transforms}
+
+
+def test_no_barrel_imports():
+    offenders = {
+        component.__name__: BARREL_RE.findall(render_esm(component, component._esm_transforms))
+        for component in esm_components()
+    }
+    assert not {name: imports for name, imports in offenders.items() if imports}
+
+
+@pytest.mark.parametrize('component', esm_components(), ids=lambda c: c.__name__)
+def test_component_source_budget(component):
+    budget = load_budget()['component_source']
+    size = gzip_size(render_esm(component, component._esm_transforms))
+    assert size <= budget, f'{component.__name__} ESM is {size} bytes gzipped, budget is {budget}'
+
+
+@pytest.mark.parametrize('component', esm_components(), ids=lambda c: c.__name__)
+def test_transform_budget(component):
+    budget = load_budget()['transform']
+    for transform, size in transform_sizes(component).items():
+        assert size <= budget[transform], (
+            f'{transform} adds {size} bytes gzipped to {component.__name__}, budget is {budget[transform]}'
+        )
+
+
+@pytest.mark.parametrize('component', esm_components(), ids=lambda c: c.__name__)
+def test_component_chunk_budget(component):
+    sizes = chunk_sizes(component.__name__)
+    if sizes is None:
+        pytest.skip('Per-component chunks have not been built.')
+    budget = load_budget()
+    limit = budget['component_overrides'].get(component.__name__, budget['component'])
+    assert sizes[0] <= limit, f'{component.__name__} entry is {sizes[0]} bytes gzipped, budget is {limit}'
+
+
+def test_bundle_budget():
+    budget = load_budget()['bundle']
+    bundles = bundle_report()['bundles']
+    if not bundles:
+        pytest.skip('Bundle has not been built.')
+    for name, sizes in bundles.items():
+        limit = budget.get(name)
+        assert limit is not None, f'No budget defined for {name}'
+        assert sizes['gzip'] <= limit, f'{name} is {sizes["gzip"]} bytes gzipped, budget is {limit}'
+
+
+def format_report(report: dict) -> str:
+    lines = [
+        f'{name}: {sizes["size"]:,} bytes ({sizes["gzip"]:,} gzipped)'
+        for name, sizes in report['bundles'].items()
+    ]
+    lines.append(f'\n{"Component":<22}{"source":>10}{"entry":>10}{"loaded":>10}')
+    lines.extend(
+        f'{name:<22}{sizes["source_gzip"]:>10,}{sizes.get("entry_gzip", "-"):>10}'
+        f'{sizes.get("loaded_gzip", "-"):>10}'
+        for name, sizes in report['components'].items()
+    )
+    lines.append(f'\n{"Transform":<22}{"max":>10}')
+    lines.extend(f'{name:<22}{size:>10,}' for name, size in report['transforms'].items())
+    return '\n'.join(lines)
+
+
+if __name__ == '__main__':
+    report = bundle_report()
+    if '--json' in sys.argv:
+        pathlib.Path(sys.argv[sys.argv.index('--json') + 1]).write_text(json.dumps(report, indent=2))
+    sys.stdout.write(format_report(report) + '\n')
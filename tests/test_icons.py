@@ -0,0 +1,92 @@
+import io
+
+import pytest
+from panel.layout import Column
+
+from panel_material_ui.icons import collect_icons, subset_icon_font
+from panel_material_ui.pane import Chip, List
+from panel_material_ui.widgets import Button, ToggleIcon
+
+
+def build_icon_font(path, icons):
+    """
+    Builds a minimal ligature font which maps each icon name to a glyph.
+    """
+    from fontTools.feaLib.builder import addOpenTypeFeaturesFromString
+    from fontTools.fontBuilder import FontBuilder
+    from fontTools.pens.ttGlyphPen import TTGlyphPen
+
+    letters = sorted(set(''.join(icons)))
+    glyph_order = ['.notdef'] + letters + list(icons)
+    pen = TTGlyphPen(None)
+    pen.moveTo((0, 0))
+    pen.lineTo((0, 100))
+    pen.lineTo((100, 0))
+    pen.closePath()
+    glyph = pen.glyph()
+    builder = FontBuilder(1000, isTTF=True)
+    builder.setupGlyphOrder(glyph_order)
+    builder.setupCharacterMap({ord(c): c for c in letters})
+    builder.setupGlyf({name: glyph for name in glyph_order})
+    builder.setupHorizontalMetrics({name: (500, 0) for name in glyph_order})
+    builder.setupHorizontalHeader(ascent=800, descent=-200)
+    builder.setupNameTable({'familyName': 'Material Icons', 'styleName': 'Regular'})
+    builder.setupOS2()
+    builder.setupPost()
+    ligatures = ''.join(f'  sub {" ".join(icon)} by {icon};\n' for icon in icons)
+    addOpenTypeFeaturesFromString(builder.font, f'feature liga {{\n{ligatures}}} liga;')
+    builder.save(path)
+    return path
+
+
+@pytest.fixture
+def icon_font(tmp_path):
+    pytest.importorskip('fontTools')
+    return build_icon_font(tmp_path / 'material-icons.ttf', ['add', 'delete', 'head', 'home', 'settings', 'zoom_in'])
+
+
+def test_collect_icons():
+    layout = Column(
+        Button(icon='home'),
+        ToggleIcon(icon='favorite', active_icon='<svg></svg>'),
+        Chip(icon='face'),
+        List(items=['inbox', {'label': 'Drafts', 'icon': 'drafts'}]),
+    )
+    assert collect_icons(layout) == ['drafts', 'face', 'favorite', 'home']
+
+
+def test_collect_icons_multiple_objects():
+    assert collect_icons(Button(icon='home'), Button(icon='add'), Button()) == ['add', 'home']
+
+
+def test_subset_icon_font(icon_font):
+    from fontTools.ttLib import TTFont
+
+    font = TTFont(io.BytesIO(subset_icon_font(['home', 'add'], icon_font)))
+    full = TTFont(icon_font)
+
+    assert font.flavor == 'woff2'
+    # Only the two ligature glyphs and the letters forming them are
+    # retained, not 'head' which is spelled with the same letters
+    assert len(font.getGlyphOrder()) == len(set('homeadd')) + 3
+    assert len(font.getGlyphOrder()) < len(full.getGlyphOrder())
+
+
+def test_subset_icon_font_ligatures(icon_font):
+    from fontTools.ttLib import TTFont
+
+    font = TTFont(io.BytesIO(subset_icon_font(['home', 'missing'], icon_font)))
+
+    ligatures = [
+        (first, *lig.Component)
+        for lookup in font['GSUB'].table.LookupList.Lookup
+        for subtable in lookup.SubTable
+        for first, ligs in subtable.ligatures.items()
+        for lig in ligs
+    ]
+    assert ligatures == [tuple('home')]
+
+
+def test_subset_icon_font_invalid_name(icon_font):
+    with pytest.raises(ValueError):
+        subset_icon_font(['home', '<svg></svg>'], icon_font)
@@ -0,0 +1,73 @@
+"""
+Guards against regressions in the cost of importing panel_material_ui.
+
+Each check runs in a fresh interpreter, since the test session has
+long since imported everything.
+"""
+import json
+import subprocess
+import sys
+
+import pytest
+
+import panel_material_ui
+import panel_material_ui.widgets
+
+
+def run_import(code):
+    script = (
+        "import sys\n"
+        f"{code}\n"
+        "print(json.dumps(sorted(sys.modules)))"
+    )
+    result = subprocess.run(
+        [sys.executable, '-c', f'import json\n{script}'],
+        capture_output=True, check=True, text=True
+    )
+    return set(json.loads(result.stdout.splitlines()[-1]))
+
+
+def test_import_is_lazy():
+    modules = run_import('import panel_material_ui')
+    loaded = {m for m in modules if m.startswith('panel_material_ui.')}
+    assert loaded == {'panel_material_ui.__version', 'panel_material_ui.theme'}
+
+
+def test_import_sets_design():
+    result = subprocess.run(
+        [sys.executable, '-c', 'import panel as pn, panel_material_ui; print(pn.config.design.__name__)'],
+        capture_output=True, check=True, text=True
+    )
+    assert result.stdout.splitlines()[-1] == 'MaterialDesign'
+
+
+def test_import_single_widget_module():
+    modules = run_import('from panel_material_ui import Button')
+    assert 'panel_material_ui.widgets.button' in modules
+    for unused in ('input', 'select', 'sliders', 'indicators'):
+        assert f'panel_material_ui.widgets.{unused}' not in modules
+    for unused in ('layout', 'pane', 'template'):
+        assert f'panel_material_ui.{unused}' not in modules
+
+
+@pytest.mark.parametrize('name', panel_material_ui.__all__)
+def test_lazy_attribute(name):
+    assert getattr(panel_material_ui, name) is not None
+    assert name in dir(panel_material_ui)
+
+
+@pytest.mark.parametrize('name', panel_material_ui.widgets.__all__)
+def test_lazy_widgets_attribute(name):
+    assert getattr(panel_material_ui.widgets, name) is not None
+    assert name in dir(panel_material_ui.widgets)
+
+
+def test_lazy_attribute_unknown():
+    with pytest.raises(AttributeError):
+        _ = panel_material_ui.DoesNotExist
+
+
+def test_star_import_matches_all():
+    namespace = {}
+    exec('from panel_material_ui import *', namespace)
+    assert set(panel_material_ui.__all__) <= set(namespace)
@@ -0,0 +1,269 @@
+import gzip
+import importlib
+import subprocess
+import sys
+
+import panel as pn
+import pytest
+from tornado.httpclient import AsyncHTTPClient
+from tornado.web import Application
+
+from panel_material_ui.base import MaterialComponent
+from panel_material_ui.widgets import Button, TextInput
+
+
+@pytest.fixture
+def server_module():
+    server = importlib.import_module('panel_material_ui.server')
+    MaterialComponent._dist_route = server.DIST_ROUTE
+    yield server
+    MaterialComponent._dist_route = None
+
+
+@pytest.fixture
+def dist(tmp_path, monkeypatch, server_module):
+    base = importlib.import_module('panel_material_ui.base')
+    (tmp_path / 'chunks').mkdir()
+    bundle = tmp_path / 'panel-material-ui.bundle.js'
+    bundle.write_text('export default {}')
+    (tmp_path / 'panel-material-ui.bundle.css').write_text('body {}')
+    monkeypatch.setattr(server_module, 'DIST_PATH', tmp_path)
+    monkeypatch.setattr(base, 'CHUNK_PATH', tmp_path / 'chunks')
+    monkeypatch.setattr(MaterialComponent, '_bundle', bundle)
+    return tmp_path
+
+
+@pytest.fixture
+async def fetch(dist, port, server_module):
+    app = Application([
+        (rf'/{server_module.DIST_ROUTE}/(.*)', server_module.DistHandler, {'path': str(dist)})
+    ])
+    server = app.listen(port)
+    client = AsyncHTTPClient()
+
+    async def fetch(url, **kwargs):
+        return await client.fetch(f'http://localhost:{port}/{url.lstrip("./")}', raise_error=False, **kwargs)
+
+    yield fetch
+    server.stop()
+
+
+def test_dist_url_content_hash(dist, server_module):
+    bundle = dist / 'panel-material-ui.bundle.js'
+    digest = server_module.content_hash(bundle)
+    assert len(digest) == 16
+    assert server_module.dist_url(bundle) == f'./panel_material_ui/dist/panel-material-ui.bundle.{digest}.js'
+
+    bundle.write_text('export default {"changed": true}')
+    assert server_module.content_hash(bundle) != digest
+
+
+def test_render_esm_self_hosted(dist, server_module):
+    (dist / 'chunks' / 'Button.js').write_text('')
+    button_url = Button._render_esm(compiled=True, server=True)
+    text_url = TextInput._render_esm(compiled=True, server=True)
+    assert button_url == server_module.dist_url(dist / 'chunks' / 'Button.js')
+    assert text_url == server_module.dist_url(dist / 'panel-material-ui.bundle.js')
+
+
+def test_get_properties_self_hosted(dist, server_module, server_document):
+    server_document.session_context.request.full_url.return_value = 'http://localhost:5006/app'
+    props = Button()._get_properties(server_document)
+    assert props['bundle'] == 'url'
+    assert props['esm'] == server_module.dist_url(dist / 'panel-material-ui.bundle.js')
+    assert props['css_bundle'] == server_module.dist_url(dist / 'panel-material-ui.bundle.css')
+
+
+def test_bundle_css_self_hosted(dist, server_module, server_document):
+    server_document.session_context.request.full_url.return_value = 'http://localhost:5006/app'
+    css_url = server_module.dist_url(dist / 'panel-material-ui.bundle.css')
+    assert Button._bundle_css == [f'http://localhost:5006/{css_url[2:]}']
+
+
+def test_bundle_css_self_hosted_icon_subset(dist, server_module, server_document, monkeypatch):
+    server_document.session_context.request.full_url.return_value = 'http://localhost:5006/app'
+    monkeypatch.setattr(pn.config, 'global_css', ["@font-face { src: url(./panel_material_ui/icons/0123456789abcdef/home.woff2) }"])
+    css_url = server_module.dist_url(dist / 'panel-material-ui.bundle.css', 'noicons')
+    assert '.noicons.' in css_url
+    assert Button._bundle_css == [f'http://localhost:5006/{css_url[2:]}']
+    assert Button()._get_properties(server_document)['css_bundle'] == css_url
+
+
+def test_bundle_css_self_hosted_no_session(dist, server_module):
+    assert not any(css.startswith('http') for css in Button._bundle_css)
+
+
+async def test_dist_handler_hashed_immutable(dist, fetch, server_module):
+    response = await fetch(server_module.dist_url(dist / 'panel-material-ui.bundle.js'))
+    assert response.code == 200
+    assert response.body == b'export default {}'
+    assert response.headers['Cache-Control'] == f'public, max-age={server_module.IMMUTABLE_MAX_AGE}, immutable'
+
+
+async def test_dist_handler_stale_hash(dist, fetch):
+    response = await fetch('panel_material_ui/dist/panel-material-ui.bundle.0123456789abcdef.js')
+    assert response.code == 404
+
+
+async def test_dist_handler_hashed_outside_root(dist, fetch, server_module, monkeypatch):
+    secret = dist.parent / 'secret.txt'
+    secret.write_text('secret')
+    digest = server_module.content_hash(secret)
+    hashed = []
+    content_hash = server_module.content_hash
+    monkeypatch.setattr(server_module, 'content_hash', lambda path: hashed.append(path) or content_hash(path))
+
+    for path in (f'../secret.{digest}.txt', f'%2E%2E/secret.{digest}.txt'):
+        response = await fetch(f'panel_material_ui/dist/{path}')
+        assert response.code in (403, 404)
+    assert hashed == []
+
+
+async def test_dist_handler_unhashed_revalidated(dist, fetch):
+    response = await fetch('panel_material_ui/dist/panel-material-ui.bundle.js')
+    assert response.code == 200
+    assert response.headers['Cache-Control'] == 'no-cache'
+
+
+async def test_dist_handler_esbuild_chunk_immutable(dist, fetch):
+    (dist / 'chunks' / 'shared-ABCD1234.js').write_text('export const a = 1')
+    response = await fetch('panel_material_ui/dist/chunks/shared-ABCD1234.js')
+    assert response.code == 200
+    assert 'immutable' in response.headers['Cache-Control']
+
+
+def test_accepted_encodings(server_module):
+    assert server_module.accepted_encodings('gzip, deflate, br') == {'gzip', 'deflate', 'br'}
+    assert server_module.accepted_encodings('br;q=0, gzip;q=0.5') == {'gzip'}
+    assert server_module.accepted_encodings('') == set()
+
+
+async def test_dist_handler_precompressed_gzip(dist, fetch):
+    (dist / 'panel-material-ui.bundle.js.gz').write_bytes(gzip.compress(b'export default {}'))
+    response = await fetch(
+        'panel_material_ui/dist/panel-material-ui.bundle.js',
+        headers={'Accept-Encoding': 'gzip'}, decompress_response=False
+    )
+    assert response.code == 200
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert 'javascript' in response.headers['Content-Type']
+    assert response.headers['Vary'] == 'Accept-Encoding'
+    assert gzip.decompress(response.body) == b'export default {}'
+
+
+async def test_dist_handler_precompressed_prefers_brotli(dist, fetch):
+    (dist / 'panel-material-ui.bundle.css.gz').write_bytes(b'gz')
+    (dist / 'panel-material-ui.bundle.css.br').write_bytes(b'br')
+    response = await fetch(
+        'panel_material_ui/dist/panel-material-ui.bundle.css',
+        headers={'Accept-Encoding': 'gzip, br'}, decompress_response=False
+    )
+    assert response.headers['Content-Encoding'] == 'br'
+    assert response.headers['Content-Type'].startswith('text/css')
+    assert response.body == b'br'
+
+
+async def test_dist_handler_uncompressed_fallback(dist, fetch):
+    (dist / 'panel-material-ui.bundle.js.br').write_bytes(b'br')
+    response = await fetch(
+        'panel_material_ui/dist/panel-material-ui.bundle.js',
+        headers={'Accept-Encoding': 'identity'}, decompress_response=False
+    )
+    assert 'Content-Encoding' not in response.headers
+    assert response.body == b'export default {}'
+
+
+async def test_no_icons_css_handler(dist, port, server_module):
+    css = dist / 'panel-material-ui.bundle.css'
+    css.write_text(
+        '@font-face {\n  font-family: "Material Icons";\n  src: url(./material-icons.woff2);\n}\n'
+        "@font-face{font-family:'Material Icons Outlined';src:url(./material-icons-outlined.woff2)}\n"
+        '.material-icons { font-family: "Material Icons"; }\n'
+    )
+    server = Application(server_module.enable_self_hosting()).listen(port)
+    client = AsyncHTTPClient()
+    try:
+        url = server_module.dist_url(css, 'noicons')
+        response = await client.fetch(f'http://localhost:{port}/{url[2:]}', raise_error=False)
+        stale = await client.fetch(
+            f'http://localhost:{port}/panel_material_ui/dist/panel-material-ui.bundle.noicons.0123456789abcdef.css',
+            raise_error=False
+        )
+    finally:
+        server.stop()
+    assert response.code == 200
+    assert response.headers['Content-Type'].startswith('text/css')
+    assert 'immutable' in response.headers['Cache-Control']
+    assert response.body.decode() == (
+        "@font-face{font-family:'Material Icons Outlined';src:url(./material-icons-outlined.woff2)}\n"
+        '.material-icons { font-family: "Material Icons"; }\n'
+    )
+    assert stale.code == 404
+
+
+@pytest.fixture
+async def fetch_icons(tmp_path, port, server_module, monkeypatch):
+    pytest.importorskip('fontTools')
+    from .test_icons import build_icon_font
+
+    font = build_icon_font(tmp_path / 'material-icons-ABCD1234.ttf', ['add', 'home', 'settings'])
+    monkeypatch.setattr(server_module, 'icon_font_path', lambda: font)
+    app = Application(server_module.enable_self_hosting())
+    server = app.listen(port)
+    client = AsyncHTTPClient()
+
+    async def fetch(url):
+        return await client.fetch(f'http://localhost:{port}/{url.lstrip("./")}', raise_error=False)
+
+    yield fetch
+    server.stop()
+
+
+async def test_icon_font_handler(fetch_icons, server_module):
+    url = server_module.icon_font_url(['home', 'add'])
+    assert url.endswith('/add,home.woff2')
+    response = await fetch_icons(url)
+    assert response.code == 200
+    assert response.headers['Content-Type'] == 'font/woff2'
+    assert 'immutable' in response.headers['Cache-Control']
+    assert response.body[:4] == b'wOF2'
+
+
+async def test_icon_font_handler_unregistered_icons(fetch_icons, server_module):
+    url = server_module.icon_font_url(['home'])
+    response = await fetch_icons(url.replace('/home.', '/add,settings.'))
+    assert response.code == 404
+
+
+async def test_icon_font_handler_stale_font(fetch_icons, server_module):
+    response = await fetch_icons('panel_material_ui/icons/0123456789abcdef/home.woff2')
+    assert response.code == 404
+
+
+def test_icon_font_stylesheet(server_module, monkeypatch, tmp_path):
+    font = tmp_path / 'material-icons-ABCD1234.woff2'
+    font.write_bytes(b'font')
+    monkeypatch.setattr(server_module, 'icon_font_path', lambda: font)
+    css = server_module.icon_font_stylesheet(['home'])
+    assert "font-family: 'Material Icons';" in css
+    assert f"url(./panel_material_ui/icons/{server_module.content_hash(font)}/home.woff2) format('woff2')" in css
+
+
+def test_import_does_not_enable_self_hosting():
+    code = (
+        "from panel_material_ui.base import MaterialComponent\n"
+        "import panel_material_ui.server as server\n"
+        "assert MaterialComponent._dist_route is None\n"
+        "assert server.ROUTES\n"
+        "assert MaterialComponent._dist_route == server.DIST_ROUTE\n"
+    )
+    subprocess.run([sys.executable, '-c', code], check=True)
+
+
+def test_enable_self_hosting(server_module):
+    MaterialComponent._dist_route = None
+    routes = server_module.enable_self_hosting()
+    assert MaterialComponent._dist_route == server_module.DIST_ROUTE
+    assert [handler for _, handler, _ in routes] == [
+        server_module.NoIconsCSSHandler, server_module.DistHandler, server_module.IconFontHandler
+    ]
@@ -0,0 +1,125 @@
+import pytest
+from bokeh.document import Document
+from bokeh.document.events import ModelChangedEvent
+from panel.config import config
+from panel.layout import Column
+
+from panel_material_ui.theme import DocumentTheme
+from panel_material_ui.widgets import Button, TextInput
+
+
+@pytest.fixture
+def global_theme():
+    DocumentTheme._global = None
+    yield
+    DocumentTheme._global = None
+
+
+def render(*objects):
+    doc = Document()
+    root = Column(*objects).get_root(doc)
+    doc.add_root(root)
+    return doc, root
+
+
+def theme_model(component, root):
+    return component._models[root.ref['id']][0].data.theme
+
+
+def test_document_theme_global(global_theme):
+    theme = DocumentTheme.for_document(Document())
+    assert DocumentTheme.for_document(Document()) is theme
+    assert DocumentTheme.for_document() is theme
+
+
+def test_document_theme_dark_from_config(global_theme):
+    with config.set(theme='dark'):
+        assert DocumentTheme.for_document().dark_theme
+
+
+def test_components_share_theme_model(global_theme):
+    widgets = [Button(), TextInput(), Button()]
+    doc, root = render(*widgets)
+
+    models = {id(theme_model(widget, root)) for widget in widgets}
+    assert len(models) == 1
+    assert len([m for m in doc.models if isinstance(m, type(theme_model(widgets[0], root)))]) == 1
+
+
+def test_theme_update_single_message(global_theme):
+    widgets = [Button() for _ in range(10)]
+    doc, root = render(*widgets)
+    events = []
+    doc.on_change(lambda event: events.append(event))
+
+    DocumentTheme.for_document(doc).dark_theme = True
+
+    assert len(events) == 1
+    assert isinstance(events[0], ModelChangedEvent)
+    assert events[0].model is theme_model(widgets[0], root)
+    assert events[0].attr == 'dark_theme'
+
+
+def test_theme_synced_from_client(global_theme):
+    button = Button()
+    _, root = render(button)
+
+    theme_model(button, root).dark_theme = True
+
+    assert DocumentTheme.for_document().dark_theme
+
+
+def test_component_theme_override(global_theme):
+    button, text = Button(), TextInput()
+    _, root = render(button, text)
+    shared = theme_model(text, root)
+
+    button.theme = theme = DocumentTheme(theme_config={'palette': {'primary': {'main': '#ff0000'}}})
+    model = theme_model(button, root)
+    assert model is not shared
+    assert model.theme_config == theme.theme_config
+
+    button.theme = None
+    assert theme_model(button, root) is shared
+
+
+def test_component_dark_theme_override_not_shared(global_theme):
+    button, text = Button(dark_theme=True), TextInput()
+    _, root = render(button, text)
+
+    assert button._models[root.ref['id']][0].data.dark_theme
+    assert text._models[root.ref['id']][0].data.dark_theme is None
+    assert not theme_model(text, root).dark_theme
+
+
+def test_theme_released_on_cleanup(global_theme):
+    layout = Column(Button(), TextInput())
+    doc = Document()
+    root = layout.get_root(doc)
+    doc.add_root(root)
+    theme = DocumentTheme.for_document(doc)
+
+    layout._cleanup(root)
+
+    assert not theme._models
+    assert not theme._users
+    assert doc not in theme._document_models
+
+
+def test_theme_relinked_on_cleanup_of_first_root(global_theme):
+    first, second = Column(Button()), Column(Button())
+    doc = Document()
+    first_root, second_root = first.get_root(doc), second.get_root(doc)
+    doc.add_root(first_root)
+    doc.add_root(second_root)
+    theme = DocumentTheme.for_document(doc)
+    model = theme_model(second[0], second_root)
+
+    first._cleanup(first_root)
+    theme.dark_theme = True
+
+    assert list(theme._models) == [second_root.ref['id']]
+    assert model.dark_theme
+
+    model.dark_theme = False
+    assert not theme.dark_theme
@@ -0,0 +1,175 @@
+"""
+Browser-side performance benchmarks.
+
+Measures first paint, time to interactive (TTI), long tasks and React
+commits for the component gallery (examples/components.py) and for
+synthetic pages with a growing number of widgets, as well as the time
+it takes to open the menu of a Select with a growing number of
+options. Run them with:
+
+    pytest tests/ui/test_performance.py --perf --browser chromium
+
+The results are written to perf_results.json, or the file pointed to
+by the PANEL_MATERIAL_UI_PERF_OUTPUT environment variable, so they can
+be compared release over release.
+
+TTI is approximated as the end of the last long task or React commit
+before the main thread stayed quiet for QUIET_MS, measured from the
+start of navigation.
+"""
+import json
+import os
+import pathlib
+import platform
+import time
+
+import pytest
+
+pytest.importorskip('playwright')
+
+import panel as pn
+from panel.tests.util import serve_component
+
+import panel_material_ui
+from panel_material_ui.template import Page
+from panel_material_ui.widgets import (
+    Button,
+    Checkbox,
+    FloatSlider,
+    Select,
+    TextInput,
+)
+
+pytestmark = pytest.mark.perf
+
+GALLERY = pathlib.Path(__file__).parents[2] / 'examples' / 'components.py'
+
+OUTPUT = pathlib.Path(os.environ.get('PANEL_MATERIAL_UI_PERF_OUTPUT', 'perf_results.json'))
+
+# How long the main thread has to stay idle to consider the page interactive
+QUIET_MS = 1000
+
+TIMEOUT_MS = 60_000
+
+# Installed before any page script runs. The fake React DevTools hook
+# is picked up by every React renderer and notified on each commit.
+INIT_SCRIPT = """
+window.__pmui_perf__ = {commits: 0, last_commit: 0, long_tasks: []}
+window.__REACT_DEVTOOLS_GLOBAL_HOOK__ = {
+  isDisabled: false,
+  supportsFiber: true,
+  renderers: new Map(),
+  inject(renderer) {
+    const id = this.renderers.size + 1
+    this.renderers.set(id, renderer)
+    return id
+  },
+  checkDCE() {},
+  onScheduleFiberRoot() {},
+  onCommitFiberUnmount() {},
+  onPostCommitFiberRoot() {},
+  onCommitFiberRoot() {
+    window.__pmui_perf__.commits += 1
+    window.__pmui_perf__.last_commit = performance.now()
+  },
+}
+new PerformanceObserver((list) => {
+  for (const entry of list.getEntries()) {
+    window.__pmui_perf__.long_tasks.push([entry.startTime, entry.duration])
+  }
+}).observe({type: 'longtask', buffered: true})
+"""
+
+COLLECT_SCRIPT = """() => {
+  const perf = window.__pmui_perf__
+  const paint = Object.fromEntries(
+    performance.getEntriesByType('paint').map((entry) => [entry.name, entry.startTime])
+  )
+  const [nav] = performance.getEntriesByType('navigation')
+  const last_task = perf.long_tasks.reduce((end, [start, duration]) => Math.max(end, start + duration), 0)
+  return {
+    now: performance.now(),
+    commits: perf.commits,
+    last_commit: perf.last_commit,
+    long_tasks: perf.long_tasks.length,
+    long_task_ms: perf.long_tasks.reduce((total, [, duration]) => total + duration, 0),
+    last_long_task: last_task,
+    first_paint: paint['first-paint'] ?? null,
+    first_contentful_paint: paint['first-contentful-paint'] ?? null,
+    dom_content_loaded: nav ? nav.domContentLoadedEventEnd : null,
+  }
+}"""
+
+WIDGETS = [
+    lambda i: TextInput(label=f'Text {i}'),
+    lambda i: Select(label=f'Select {i}', options=['A', 'B', 'C']),
+    lambda i: Button(label=f'Button {i}'),
+    lambda i: Checkbox(label=f'Check {i}'),
+    lambda i: FloatSlider(label=f'Slider {i}', start=0, end=10),
+]
+
+
+@pytest.fixture(scope='module')
+def perf_results():
+    results = []
+    yield results
+    if not results:
+        return
+    OUTPUT.write_text(json.dumps({
+        'version': panel_material_ui.__version__,
+        'panel_version': pn.__version__,
+        'platform': platform.platform(),
+        'timestamp': time.time(),
+        'results': results,
+    }, indent=2))
+
+
+def measure(page, app, min_commits=1):
+    page.add_init_script(INIT_SCRIPT)
+    serve_component(page, app)
+    deadline = time.monotonic() + TIMEOUT_MS / 1000
+    while True:
+        metrics = page.evaluate(COLLECT_SCRIPT)
+        busy_until = max(metrics['last_commit'], metrics['last_long_task'], metrics['dom_content_loaded'] or 0)
+        if metrics['commits'] >= min_commits and metrics['now'] - busy_until >= QUIET_MS:
+            break
+        if time.monotonic() > deadline:
+            pytest.fail(f'Page did not become interactive within {TIMEOUT_MS} ms: {metrics}')
+        page.wait_for_timeout(50)
+    return {
+        'first_paint_ms': metrics['first_paint'],
+        'first_contentful_paint_ms': metrics['first_contentful_paint'],
+        'tti_ms': busy_until,
+        'long_tasks': metrics['long_tasks'],
+        'long_task_ms': metrics['long_task_ms'],
+        'react_commits': metrics['commits'],
+    }
+
+
+def test_gallery_performance(page, perf_results):
+    result = measure(page, str(GALLERY))
+    perf_results.append({'name': 'gallery', **result})
+
+
+@pytest.mark.parametrize('n', [10, 50, 200])
+def test_widgets_performance(page, perf_results, n):
+    def app():
+        widgets = [WIDGETS[i % len(WIDGETS)](i) for i in range(n)]
+        return Page(main=widgets, title=f'{n} widgets')
+
+    # Every widget and the Page mount their own React root
+    result = measure(page, app, min_commits=n + 1)
+    perf_results.append({'name': 'widgets', 'n_widgets': n, **result})
+
+
+@pytest.mark.parametrize('virtualize', [False, True])
+@pytest.mark.parametrize('n', [100, 1000, 10_000])
+def test_select_open_performance(page, perf_results, n, virtualize):
+    widget = Select(label='Select', options=[f'Option {i}' for i in range(n)], virtualize=virtualize)
+    measure(page, widget)
+
+    start = time.perf_counter()
+    page.locator('.MuiSelect-select').click()
+    page.locator('.MuiMenuItem-root').first.wait_for()
+    open_ms = (time.perf_counter() - start) * 1000
+    perf_results.append({'name': 'select_open', 'n_options': n, 'virtualize': virtualize, 'open_ms': open_ms})
@@ -3,7 +3,7 @@ import pytest
 pytest.importorskip('playwright')
 
 from panel.tests.util import serve_component, wait_until
-from panel_material_ui.widgets import AutocompleteInput, Select, RadioBoxGroup, RadioButtonGroup, CheckButtonGroup
+from panel_material_ui.widgets import AutocompleteInput, MultiChoice, Select, RadioBoxGroup, RadioButtonGroup, CheckButtonGroup
 from playwright.sync_api import expect
 
 pytestmark = pytest.mark.ui
@@ -94,6 +94,73 @@ def test_select_variant(page, variant):
     expect(page.locator(f".MuiSelect-{variant}")).to_have_count(1)
 
 
+def test_select_virtualize_renders_window(page):
+    widget = Select(name='Select test', options=[f'Option {i}' for i in range(10_000)], virtualize=True)
+    serve_component(page, widget)
+
+    page.locator(".MuiSelect-select").click()
+    items = page.locator(".MuiMenuItem-root")
+    expect(items.first).to_have_text("Option 0")
+    assert items.count() < 20
+
+    page.locator(".MuiPaper-root.MuiMenu-paper").evaluate("el => el.scrollTop = 36 * 5000")
+    expect(page.locator(".MuiMenuItem-root", has_text="Option 5000")).to_have_count(1)
+    assert items.count() < 30
+
+
+def test_select_virtualize_keyboard_navigation(page):
+    options = [f'Option {i}' for i in range(1000)]
+    widget = Select(
+        name='Select test', options=options, value='Option 0', virtualize=True,
+        disabled_options=['Option 1', 'Option 999']
+    )
+    serve_component(page, widget)
+
+    page.locator(".MuiSelect-select").click()
+    page.keyboard.press("ArrowDown")
+    page.keyboard.press("Enter")
+    wait_until(lambda: widget.value == 'Option 2', page)
+
+    page.locator(".MuiSelect-select").click()
+    page.keyboard.press("End")
+    page.keyboard.press("Enter")
+    wait_until(lambda: widget.value == 'Option 998', page)
+
+    page.locator(".MuiSelect-select").click()
+    page.keyboard.press("Home")
+    page.keyboard.press("Enter")
+    wait_until(lambda: widget.value == 'Option 0', page)
+
+
+def test_select_patch_options(page):
+    widget = Select(name='Select test', options=['Option 0', 'Option 1'])
+    serve_component(page, widget)
+
+    widget.append_option('Option 2')
+    widget.insert_option(0, 'Option -1')
+    widget.remove_option('Option 1')
+
+    page.locator(".MuiSelect-select").click()
+    expect(page.locator(".MuiMenuItem-root")).to_have_text(['Option -1', 'Option 0', 'Option 2'])
+
+    page.locator(".MuiMenuItem-root", has_text="Option 2").click()
+    wait_until(lambda: widget.value == 'Option 2', page)
+
+
+def test_multi_choice_virtualize_renders_window(page):
+    widget = MultiChoice(name='MultiChoice test', options=[f'Option {i}' for i in range(10_000)], virtualize=True)
+    serve_component(page, widget)
+
+    page.locator(".MuiSelect-select").click()
+    items = page.locator(".MuiMenuItem-root")
+    expect(items.first).to_have_text("Option 0")
+    assert items.count() < 20
+
+    page.keyboard.press("End")
+    page.keyboard.press("Enter")
+    wait_until(lambda: widget.value == ['Option 9999'], page)
+
+
 @pytest.mark.parametrize('color', ["primary", "secondary", "error", "info", "success", "warning"])
 def test_radio_box_group_color(page, color):
     widget = RadioBoxGroup(name='RadioBoxGroup test', options=["Option 1", "Option 2", "Option 3"], color=color)
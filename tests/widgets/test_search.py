@@ -0,0 +1,90 @@
+import pytest
+
+from panel_material_ui.widgets.search import OptionIndex, SearchIndex
+
+OPTIONS = ['Biology', 'biochemistry', 'Chemistry', 'Physics', 'Astrophysics', 'Bio']
+
+
+def test_search_index_starts_with_sorted():
+    index = SearchIndex(OPTIONS)
+    assert index.starts_with('Bio') == ['Bio', 'Biology']
+    assert index.starts_with('bio') == ['biochemistry']
+    assert index.starts_with('X') == []
+
+
+def test_search_index_starts_with_case_insensitive():
+    index = SearchIndex(OPTIONS, case_sensitive=False)
+    assert index.starts_with('BIO') == ['Bio', 'biochemistry', 'Biology']
+
+
+def test_search_index_includes_original_order():
+    index = SearchIndex(OPTIONS)
+    assert index.includes('hemistry') == ['biochemistry', 'Chemistry']
+    assert index.includes('physics') == ['Astrophysics']
+    assert index.includes('xyz') == []
+
+
+def test_search_index_includes_case_insensitive():
+    index = SearchIndex(OPTIONS, case_sensitive=False)
+    assert index.includes('PHYSICS') == ['Physics', 'Astrophysics']
+
+
+def test_search_index_includes_short_query():
+    index = SearchIndex(OPTIONS)
+    assert index.includes('y') == ['Biology', 'biochemistry', 'Chemistry', 'Physics', 'Astrophysics']
+    assert index.includes('') == OPTIONS
+
+
+@pytest.mark.parametrize('strategy', ['starts_with', 'includes'])
+def test_search_index_limit(strategy):
+    options = [f'Option {i:04d}' for i in range(1000)]
+    index = SearchIndex(options)
+    assert index.search('Option', strategy, limit=5) == options[:5]
+
+
+@pytest.mark.parametrize('strategy', ['starts_with', 'includes'])
+@pytest.mark.parametrize('case_sensitive', [True, False])
+@pytest.mark.parametrize('query', ['ch', 'Chem', 'is', 'istry', 'o', 'Zz'])
+def test_search_index_matches_scan(strategy, case_sensitive, query):
+    index = SearchIndex(OPTIONS, case_sensitive=case_sensitive)
+    norm = (lambda s: s) if case_sensitive else str.lower
+    if strategy == 'starts_with':
+        expected = sorted((o for o in OPTIONS if norm(o).startswith(norm(query))), key=norm)
+    else:
+        expected = [o for o in OPTIONS if norm(query) in norm(o)]
+    assert index.search(query, strategy) == expected
+
+
+def test_search_index_unknown_strategy():
+    with pytest.raises(ValueError):
+        SearchIndex(OPTIONS).search('Bio', 'fuzzy')
+
+
+def test_option_index_first_position():
+    index = OptionIndex(['A', 1, 'B', 1.0, 'A'], ['A', '1', 'B', '1.0', 'A'])
+    assert index.index('A') == 0
+    assert index.index(1.0) == 1
+    assert index.index('C') is None
+    assert index.label_index('1.0') == 3
+    assert index.unicode_index('1.0') == 3
+    assert 'B' in index
+    assert 'C' not in index
+
+
+def test_option_index_unhashable():
+    index = OptionIndex(['A', [1, 2], 'B', {'a': 1}])
+    assert index.index([1, 2]) == 1
+    assert index.index({'a': 1}) == 3
+    assert index.index('B') == 2
+    assert [3] not in index
+
+
+def test_option_index_unique():
+    assert OptionIndex([1, 2], ['1', '2']).unique
+    assert not OptionIndex([1, '1'], ['a', 'b']).unique
+
+
+def test_option_index_default_labels():
+    index = OptionIndex([1, 2])
+    assert index.labels == ['1', '2']
+    assert index.items == {'1': 1, '2': 2}
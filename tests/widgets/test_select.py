@@ -1,4 +1,10 @@
-from panel_material_ui.widgets import AutocompleteInput
+import asyncio
+
+import param
+import pytest
+from panel.util import edit_readonly
+
+from panel_material_ui.widgets import AutocompleteInput, MultiChoice, Select
 
 
 def test_autocomplete_reset_none(document, comm):
@@ -11,3 +17,364 @@ def test_autocomplete_reset_none(document, comm):
     model.data.value = None
 
     assert widget.value is None
+
+
+def set_value_input(widget, value):
+    with edit_readonly(widget):
+        widget.value_input = value
+
+
+def test_autocomplete_server_search():
+    widget = AutocompleteInput(
+        options=[f'Option {i}' for i in range(100)], search_mode='server', search_option_limit=3
+    )
+
+    set_value_input(widget, 'Option 1')
+    assert widget.completions == ['Option 1', 'Option 10', 'Option 11']
+
+    set_value_input(widget, 'O')
+    assert widget.completions == []
+
+    widget.param.update(search_strategy='includes', case_sensitive=False)
+    set_value_input(widget, 'ion 9')
+    assert widget.completions == ['Option 9', 'Option 90', 'Option 91']
+
+
+def test_autocomplete_server_search_options_update():
+    widget = AutocompleteInput(options=['Apple', 'Banana'], search_mode='server')
+
+    set_value_input(widget, 'Ch')
+    assert widget.completions == []
+
+    widget.options = ['Apple', 'Cherry']
+    assert widget.completions == ['Cherry']
+
+
+def test_autocomplete_server_search_does_not_send_options():
+    widget = AutocompleteInput(options=['Apple', 'Banana'], search_mode='server')
+
+    assert widget._process_param_change({'options': widget.options})['options'] == []
+
+    widget.search_mode = 'client'
+    assert widget._process_param_change({'options': widget.options})['options'] == ['Apple', 'Banana']
+
+
+def test_autocomplete_client_search_no_completions():
+    widget = AutocompleteInput(options=['Apple', 'Banana'])
+
+    set_value_input(widget, 'Apple')
+    assert widget.completions == []
+
+
+def test_autocomplete_search_mode_resends_options(document, comm):
+    widget = AutocompleteInput(options=['Apple', 'Banana'], search_mode='server')
+
+    model = widget.get_root(document, comm=comm)
+
+    assert model.data.options == []
+
+    widget.search_mode = 'client'
+
+    assert model.data.options == ['Apple', 'Banana']
+    assert model.data.value is None
+
+
+def test_autocomplete_sync_completer():
+    widget = AutocompleteInput(
+        search_mode='server', search_option_limit=2,
+        completer=lambda query: [f'{query} {i}' for i in range(5)]
+    )
+
+    set_value_input(widget, 'Fo')
+    assert widget.completions == ['Fo 0', 'Fo 1']
+
+
+def test_autocomplete_search_msg_tags_query_id():
+    widget = AutocompleteInput(options=['Apple', 'Apricot'], search_mode='server')
+
+    widget._handle_msg({'type': 'search', 'query': 'Ap', 'id': 'view:3'})
+    assert widget.completions == ['Apple', 'Apricot']
+    assert widget.query_id == 'view:3'
+
+    # Queries made on the server answer the latest browser query
+    set_value_input(widget, 'Apr')
+    assert widget.completions == ['Apricot']
+    assert widget.query_id == 'view:3'
+
+
+def test_autocomplete_unrestricted_value(document, comm):
+    widget = AutocompleteInput(options=['Apple', 'Apricot'], restrict=False, value='Banana')
+    model = widget.get_root(document, comm=comm)
+    assert widget.value == model.data.value == 'Banana'
+
+    widget.value = 'Apple'
+    assert model.data.value == 'Apple'
+
+
+def test_autocomplete_query_ids_scoped_per_view():
+    widget = AutocompleteInput(options=['Apple', 'Apricot', 'Banana'], search_mode='server')
+
+    widget._handle_msg({'type': 'search', 'query': 'Ap', 'id': 'first:5'})
+    # A newly created view starts counting its queries from the start
+    widget._handle_msg({'type': 'search', 'query': 'Ba', 'id': 'second:1'})
+
+    assert widget.completions == ['Banana']
+    assert widget.query_id == 'second:1'
+
+
+def test_autocomplete_search_debounced():
+    queries = []
+
+    async def completer(query):
+        queries.append(query)
+        return [query]
+
+    widget = AutocompleteInput(search_mode='server', completer=completer, debounce=20)
+
+    async def type_query():
+        for i, query in enumerate(['Ap', 'App', 'Appl'], start=1):
+            widget._handle_msg({'type': 'search', 'query': query, 'id': f'view:{i}'})
+            await asyncio.sleep(0)
+        await asyncio.sleep(0.05)
+
+    asyncio.run(type_query())
+
+    assert queries == ['Appl']
+    assert widget.completions == ['Appl']
+    assert widget.query_id == 'view:3'
+
+
+def test_autocomplete_search_cancels_stale_lookup():
+    cancelled = []
+
+    async def completer(query):
+        try:
+            await asyncio.sleep(0.01 if query == 'Appl' else 1)
+        except asyncio.CancelledError:
+            cancelled.append(query)
+            raise
+        return [query]
+
+    widget = AutocompleteInput(search_mode='server', completer=completer, debounce=0)
+
+    async def type_query():
+        widget._handle_msg({'type': 'search', 'query': 'App', 'id': 'view:1'})
+        await asyncio.sleep(0.005)
+        widget._handle_msg({'type': 'search', 'query': 'Appl', 'id': 'view:2'})
+        await asyncio.sleep(0.05)
+
+    asyncio.run(type_query())
+
+    assert cancelled == ['App']
+    assert widget.completions == ['Appl']
+    assert widget.query_id == 'view:2'
+
+
+def test_autocomplete_completions_query():
+    widget = AutocompleteInput(options=['Apple', 'Apricot'], search_mode='server')
+
+    widget._handle_msg({'type': 'search', 'query': 'Apr', 'id': 'view:1'})
+    assert widget.completions == ['Apricot']
+    assert widget.completions_query == 'Apr'
+
+
+@pytest.mark.parametrize('param', ['options', 'case_sensitive', 'search_option_limit', 'search_strategy'])
+def test_autocomplete_search_params_invalidate_cache(param):
+    widget = AutocompleteInput(options=['Apple', 'Apricot'], search_mode='server')
+    msgs = []
+    widget._send_msg = msgs.append
+
+    widget.param.update(**{param: {
+        'options': ['Apple'], 'case_sensitive': False,
+        'search_option_limit': 5, 'search_strategy': 'includes'
+    }[param]})
+
+    assert msgs == [{'type': 'invalidate'}]
+
+
+def test_autocomplete_client_search_does_not_invalidate_cache():
+    widget = AutocompleteInput(options=['Apple', 'Apricot'])
+    msgs = []
+    widget._send_msg = msgs.append
+
+    widget.options = ['Apple']
+
+    assert msgs == []
+
+
+def test_autocomplete_completer_sent_as_flag():
+    widget = AutocompleteInput(search_mode='server', completer=lambda query: [query])
+
+    assert widget._process_param_change({'completer': widget.completer})['completer'] is True
+    assert widget._process_param_change({'completer': None})['completer'] is False
+
+
+def test_select_large_options_sync(document, comm):
+    options = {f'Option {i}': i for i in range(10_000)}
+    widget = Select(options=options, value=9_999)
+
+    model = widget.get_root(document, comm=comm)
+
+    assert model.data.value == '9999'
+    model.data.value = '5000'
+    assert widget.value == 5000
+
+
+def test_select_options_change_rebuilds_index(document, comm):
+    widget = Select(options=['A', 'B'], value='B')
+    model = widget.get_root(document, comm=comm)
+
+    widget.options = ['C', 'D']
+
+    assert widget.value == 'C'
+    assert model.data.options == ['C', 'D']
+    assert 'A' not in widget._index
+
+
+def test_select_options_inplace_change_rebuilds_index():
+    widget = Select(options=['A', 'B'])
+    widget.options.append('C')
+    widget.param.trigger('options')
+
+    widget.value = 'C'
+    assert widget.values == ['A', 'B', 'C']
+
+
+def test_select_unhashable_options(document, comm):
+    widget = Select(options={'a': [1], 'b': [2]}, value=[2])
+
+    model = widget.get_root(document, comm=comm)
+
+    assert model.data.value == '[2]'
+    model.data.value = '[1]'
+    assert widget.value == [1]
+
+
+def test_select_disabled_options_validated_with_index():
+    widget = Select(options=list(range(1000)), disabled_options=[1, 2], value=0)
+
+    with pytest.raises(ValueError, match='disabled option'):
+        widget.value = 2
+    with pytest.raises(ValueError, match='non existing'):
+        widget.disabled_options = [1000]
+
+    widget.disabled_options = [3]
+    widget.value = 2
+    assert widget.value == 2
+
+
+def test_multi_choice_large_options_sync(document, comm):
+    widget = MultiChoice(options=[f'Option {i}' for i in range(10_000)], value=['Option 9999', 'Missing'])
+
+    model = widget.get_root(document, comm=comm)
+
+    assert model.data.value == ['Option 9999']
+    model.data.value = ['Option 1', 'Option 2']
+    assert widget.value == ['Option 1', 'Option 2']
+
+    widget.options = ['Option 2']
+    assert widget.value == ['Option 2']
+
+
+def options_events(document):
+    events = []
+    document.on_change(lambda event: events.append(getattr(event, 'attr', None)))
+    return events
+
+
+@pytest.mark.parametrize('widget_type', [AutocompleteInput, MultiChoice, Select])
+def test_patch_options(document, comm, widget_type):
+    widget = widget_type(options=['A', 'B', 'C'])
+    model = widget.get_root(document, comm=comm)
+    document.add_root(model)
+    events, msgs = options_events(document), []
+    widget._send_msg = msgs.append
+
+    widget.append_option('D')
+    widget.extend_options(['E', 'F'])
+    widget.insert_option(-1, 'G')
+    widget.remove_option('B')
+
+    assert widget.options == ['A', 'C', 'D', 'E', 'G', 'F']
+    assert model.data.options == widget.options
+    assert 'options' not in events
+    assert [msg for msg in msgs if msg['type'] == 'options'] == [
+        {'type': 'options', 'index': 3, 'remove': 0, 'options': ['D']},
+        {'type': 'options', 'index': 4, 'remove': 0, 'options': ['E', 'F']},
+        {'type': 'options', 'index': 5, 'remove': 0, 'options': ['G']},
+        {'type': 'options', 'index': 1, 'remove': 1, 'options': []},
+    ]
+
+    widget.options = ['A', 'C', 'D']
+    assert model.data.options == ['A', 'C', 'D']
+    assert 'options' in events
+
+
+@pytest.mark.parametrize('widget_type', [AutocompleteInput, MultiChoice, Select])
+def test_patch_options_rendered_like_options(document, comm, widget_type):
+    options = [param.Parameterized(name='Foo'), param.Parameterized(name='Bar'), 1]
+    widget = widget_type(options=options[:1])
+    model = widget.get_root(document, comm=comm)
+    msgs = []
+    widget._send_msg = msgs.append
+
+    widget.extend_options(options[1:])
+
+    expected = widget_type(options=options).get_root(document, comm=comm).data.options
+    assert model.data.options == expected
+    assert [msg['options'] for msg in msgs if msg['type'] == 'options'] == [expected[1:]]
+
+
+def test_patch_options_notifies_watchers():
+    widget = Select(options=['A', 'B'])
+    events = []
+    widget.param.watch(events.append, 'options')
+
+    widget.append_option('C')
+
+    assert len(events) == 1
+    widget.value = 'C'
+    assert widget.value == 'C'
+
+
+def test_patch_options_remove_value(document, comm):
+    widget = Select(options=['A', 'B'], value='B')
+    model = widget.get_root(document, comm=comm)
+    widget.remove_option('B')
+    assert widget.value == model.data.value == 'A'
+
+    widget = MultiChoice(options=['A', 'B'], value=['A', 'B'])
+    model = widget.get_root(document, comm=comm)
+    widget.remove_option('B')
+    assert widget.value == model.data.value == ['A']
+
+
+def test_patch_options_errors():
+    widget = Select(options=['A'])
+    with pytest.raises(ValueError):
+        widget.remove_option('B')
+
+    widget = Select(options={'a': 1})
+    with pytest.raises(TypeError):
+        widget.append_option(2)
+
+
+def test_patch_options_server_search(document, comm):
+    widget = AutocompleteInput(options=['Apple', 'Banana'], search_mode='server', min_characters=1)
+    model = widget.get_root(document, comm=comm)
+    msgs = []
+    widget._send_msg = msgs.append
+
+    widget.append_option('Avocado')
+    set_value_input(widget, 'A')
+
+    assert model.data.options == []
+    assert msgs == [{'type': 'invalidate'}]
+    assert widget.completions == ['Apple', 'Avocado']
+
+
+@pytest.mark.parametrize('widget_type', [AutocompleteInput, MultiChoice, Select])
+def test_option_hooks_injected_once(widget_type):
+    esm = widget_type._render_esm_base()
+    assert esm.count('function usePatchedOptions(') == 1
+    assert esm.count('function useVirtualMenu(') == (widget_type is not AutocompleteInput)